@@ -4,12 +4,16 @@ Display Configuration
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Tuple, Optional
 
+# プリセット設定キャッシュの最大エントリ数（フォントサイズ違いを想定）
+PRESET_CACHE_MAX_SIZE = 32
 
-@dataclass
+
+@dataclass(frozen=True)
 class DisplayConfig:
-    """表示設定の管理クラス"""
+    """表示設定の管理クラス（プリセットを共有キャッシュするため不変）"""
     
     # 必須設定
     resolution: Tuple[int, int]  # (width, height)
@@ -39,12 +43,12 @@ class DisplayConfig:
     
     def __post_init__(self):
         """初期化後の処理"""
-        # 自動計算が必要な値を設定
+        # 自動計算が必要な値を設定（frozen のため object.__setattr__ で初期化）
         if self.max_chars_per_line is None:
-            self.max_chars_per_line = self._calculate_max_chars_per_line()
+            object.__setattr__(self, 'max_chars_per_line', self._calculate_max_chars_per_line())
         
         if self.max_lines_per_screen is None:
-            self.max_lines_per_screen = self._calculate_max_lines_per_screen()
+            object.__setattr__(self, 'max_lines_per_screen', self._calculate_max_lines_per_screen())
     
     def _calculate_max_chars_per_line(self) -> int:
         """1行の最大文字数を計算"""
@@ -62,7 +66,9 @@ class DisplayConfig:
         max_lines = int(effective_height / line_height)
         return max(max_lines, 1)  # 最小1行保証
     
+    # ファクトリメソッド（同一引数では生成済みの不変インスタンスを返す）
     @classmethod
+    @lru_cache(maxsize=PRESET_CACHE_MAX_SIZE)
     def create_mobile_portrait(cls, font_size: int = 64) -> 'DisplayConfig':
         """モバイル縦画面用の設定を作成"""
         return cls(
@@ -73,6 +79,7 @@ class DisplayConfig:
         )
     
     @classmethod
+    @lru_cache(maxsize=PRESET_CACHE_MAX_SIZE)
     def create_desktop(cls, font_size: int = 48) -> 'DisplayConfig':
         """デスクトップ用の設定を作成"""
         return cls(
@@ -83,6 +90,7 @@ class DisplayConfig:
         )
     
     @classmethod
+    @lru_cache(maxsize=PRESET_CACHE_MAX_SIZE)
     def create_mobile_landscape(cls, font_size: int = 48) -> 'DisplayConfig':
         """モバイル横画面用の設定を作成"""
         return cls(
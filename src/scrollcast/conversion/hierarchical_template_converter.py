@@ -4,10 +4,10 @@ Hierarchical Template-based ASS to HTML converter
 """
 
 import re
-import json
 import os
+import sys
 from typing import List, Dict, Any
-from .utils import ASSTimeUtils, ASSMetadataExtractor, ASSDialogueParser
+from .utils import ASSTimeUtils, ASSMetadataExtractor, ASSDialogueParser, JSONUtils, escape_text
 from .typewriter_fade_plugin_converter import TypewriterFadePluginConverter, CharacterTiming
 from .railway_scroll_plugin_converter import RailwayScrollPluginConverter
 from .simple_role_plugin_converter import SimpleRolePluginConverter
@@ -71,17 +71,23 @@ class HierarchicalTemplateConverter:
         timing_data = self._extract_timing_data()
         sentences_count = len(timing_data) if timing_data else 0
         
-        print(f"✅ Hierarchical Template HTML generation completed:")
-        print(f"   Template: {self.template_name} (Category: {self.template_info['category']})")
-        print(f"   Input: {ass_file_path}")
-        print(f"   Output: {html_output_path}")
-        print(f"   Template Path: {self.template_info['template_path']}")
-        print(f"   Lines: {sentences_count}")
+        # ログは1回の書き込みにまとめて出力（行ごとのロック・フラッシュを回避）
+        log_lines = [
+            "✅ Hierarchical Template HTML generation completed:",
+            f"   Template: {self.template_name} (Category: {self.template_info['category']})",
+            f"   Input: {ass_file_path}",
+            f"   Output: {html_output_path}",
+            f"   Template Path: {self.template_info['template_path']}",
+            f"   Lines: {sentences_count}",
+        ]
         
         # 文字数を計算
         if hasattr(self.data_converter, 'characters') and self.data_converter.characters:
             total_chars = sum(len(char.char) for char in self.data_converter.characters)
-            print(f"   Characters: {total_chars}")
+            log_lines.append(f"   Characters: {total_chars}")
+        
+        log_lines.append("")
+        sys.stdout.write("\n".join(log_lines))
     
     def _load_hierarchical_template(self) -> str:
         """階層テンプレート構造からtemplate.htmlを読み込み"""
@@ -110,24 +116,10 @@ class HierarchicalTemplateConverter:
     
     def _extract_typewriter_timing_data(self) -> List[Dict[str, Any]]:
         """TypewriterFade用タイミングデータを抽出"""
-        # 行番号でグループ化
-        sentences_dict = {}
-        
-        for timing in self.data_converter.character_timings:
-            line_number = timing.line_number
-            if line_number not in sentences_dict:
-                sentences_dict[line_number] = []
-            sentences_dict[line_number].append(timing)
-        
-        # 開始時間順にソート
-        sorted_sentences = sorted(sentences_dict.items(), key=lambda x: min(t.fade_start_ms for t in x[1]))
-        
-        # タイミングデータを生成
+        # 文ごとのグループ化・ソートは変換器の解析結果を再利用
         timing_data = []
         
-        for sequence_index, (line_number, char_timings) in enumerate(sorted_sentences):
-            sorted_chars = sorted(char_timings, key=lambda x: x.fade_start_ms)
-            
+        for sequence_index, sorted_chars in enumerate(self.data_converter.sentence_timings):
             # 文の開始・終了時間
             sentence_start = min(t.dialogue_start_ms for t in sorted_chars)
             sentence_end = max(t.dialogue_end_ms for t in sorted_chars)
@@ -236,22 +228,10 @@ class HierarchicalTemplateConverter:
     
     def _generate_typewriter_sentences_html(self) -> str:
         """TypewriterFade用の文要素HTMLを生成"""
-        # 行番号でグループ化
-        sentences_dict = {}
-        
-        for timing in self.data_converter.character_timings:
-            line_number = timing.line_number
-            if line_number not in sentences_dict:
-                sentences_dict[line_number] = []
-            sentences_dict[line_number].append(timing)
-        
-        # HTMLを生成
+        # HTMLを生成（文ごとのグループ化・ソートは変換器の解析結果を再利用）
         html_parts = []
-        sorted_sentences = sorted(sentences_dict.items(), key=lambda x: min(t.fade_start_ms for t in x[1]))
         
-        for sequence_index, (line_number, char_timings) in enumerate(sorted_sentences):
-            sorted_chars = sorted(char_timings, key=lambda x: x.fade_start_ms)
-            
+        for sequence_index, sorted_chars in enumerate(self.data_converter.sentence_timings):
             # 文字要素を生成
             char_elements = []
             for timing in sorted_chars:
@@ -261,6 +241,8 @@ class HierarchicalTemplateConverter:
                     char = '&nbsp;'  # ノーブレークスペース
                 elif char == '\t':
                     char = '&nbsp;&nbsp;&nbsp;&nbsp;'  # タブを4つのスペースに
+                else:
+                    char = escape_text(char)
                 char_elements.append(f'<span class="typewriter-char">{char}</span>')
             
             # 文要素を生成
@@ -276,7 +258,7 @@ class HierarchicalTemplateConverter:
         html_parts = []
         
         for sequence_index, line_timing in enumerate(self.data_converter.line_timings):
-            line_html = f'        <div class="railway-line" data-sequence="{sequence_index}">{line_timing.text}</div>'
+            line_html = f'        <div class="railway-line" data-sequence="{sequence_index}">{escape_text(line_timing.text)}</div>'
             html_parts.append(line_html)
         
         return "\n".join(html_parts)
@@ -286,7 +268,7 @@ class HierarchicalTemplateConverter:
         html_parts = []
         
         for sequence_index, line_timing in enumerate(self.data_converter.line_timings):
-            line_html = f'        <div class="scroll-line" data-sequence="{sequence_index}">{line_timing.text}</div>'
+            line_html = f'        <div class="scroll-line" data-sequence="{sequence_index}">{escape_text(line_timing.text)}</div>'
             html_parts.append(line_html)
         
         return "\n".join(html_parts)
@@ -323,11 +305,11 @@ class HierarchicalTemplateConverter:
             html = html.replace("{{LINES_HTML}}", sentences_html)
         
         # タイミングデータ
-        timing_json = json.dumps(timing_data, ensure_ascii=False, indent=4)
+        timing_json = JSONUtils.dumps(timing_data)
         html = html.replace("{{TIMING_DATA}}", timing_json)
         
         # テンプレート設定
-        config_json = json.dumps(template_config, ensure_ascii=False, indent=4)
+        config_json = JSONUtils.dumps(template_config)
         html = html.replace("{{TEMPLATE_CONFIG}}", config_json)
         
         return html
@@ -5,16 +5,165 @@ Base class for Plugin-based ASS to HTML converters
 
 import re
 import os
+import sys
 import yaml
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
-from .utils import ASSMetadata, HTMLTemplateBuilder
+from functools import lru_cache
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple, Union
+from .utils import ASSMetadata, HTMLTemplateBuilder, JSONUtils
 from .plugin_system import TemplateConfig, TemplateComposer
 from ..deployment.file_deployer import FileDeployer
 
 
+# ASSオーバーライドタグ ({...}) のパターン
+ASS_TAG_PATTERN = re.compile(r'\{[^}]*\}')
+
+# HTML書き込み時のバッファサイズ（1MiB）
+HTML_WRITE_BUFFER_SIZE = 1 << 20
+
+# HTML構成要素キャッシュの最大エントリ数
+SKELETON_CACHE_MAX_SIZE = 64
+
+# レスポンシブCSSクラスに含まれるキーワード → デスクトップ表示用の追加CSS（先頭から判定）
+RESPONSIVE_ADDITIONAL_CSS: Tuple[Tuple[str, str], ...] = (
+    # SimpleRole等のスクロール系は中央寄せ
+    ("scroll", """
+                max-width: 800px;
+                margin: 0 auto;"""),
+    ("railway", """
+                max-width: 600px;"""),
+    ("typewriter", """
+                max-width: 600px;"""),
+)
+
+# テンプレート名 → (カテゴリ, テンプレートディレクトリ名)
+TEMPLATE_ASSET_IDS: Dict[str, Tuple[str, str]] = {
+    "typewriter_fade": ("typewriter", "typewriter_fade"),
+    "typewriter_pop": ("typewriter", "typewriter_pop"),
+    "typewriter_fill_screen": ("typewriter", "typewriter_fill_screen"),
+    "railway_scroll": ("railway", "railway_scroll"),
+    "simple_role": ("scroll", "scroll_role"),
+    "revolver_up": ("scroll", "revolver_up"),
+}
+
+
+@lru_cache(maxsize=32)
+def _build_plugin_script_tags(required_plugins: Tuple[str, ...]) -> str:
+    """プラグイン構成ごとのスクリプトタグ文字列を生成（プラグイン構成単位でキャッシュ）"""
+    return '\n'.join(
+        f'    <script src="plugins/{plugin_name.replace("_", "-")}-plugin.js"></script>'
+        for plugin_name in required_plugins
+    )
+
+
+@lru_cache(maxsize=64)
+def _build_template_css_links(template_category: str, template_name: str,
+                              external_css_links: Tuple[str, ...]) -> str:
+    """テンプレート固有のCSS外部参照リンク文字列を生成（入力単位でキャッシュ）"""
+    css_path = f"templates/{template_category}/{template_name}/sc-template.css"
+    links = [
+        '    <!-- Template Specific Styles -->',
+        f'    <link rel="stylesheet" href="{css_path}">'
+    ]
+    links.extend(external_css_links)
+    return '\n'.join(links)
+
+
+@lru_cache(maxsize=32)
+def _load_text_file_cached(file_path: str, mtime: float) -> str:
+    """テキストファイルを読み込む（パスと更新時刻の組でキャッシュ）"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+@lru_cache(maxsize=8)
+def _load_yaml_file_cached(config_path: str, mtime: float) -> Dict[str, Any]:
+    """YAMLファイルを読み込む（パスと更新時刻の組でキャッシュ）"""
+    with open(config_path, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)
+
+
+@lru_cache(maxsize=None)
+def _get_responsive_additional_css(css_class: str) -> str:
+    """CSSクラスに対応するデスクトップ表示用の追加CSSを取得"""
+    for keyword, additional_css in RESPONSIVE_ADDITIONAL_CSS:
+        if keyword in css_class:
+            return additional_css
+    return ""
+
+
+def _build_responsive_css_parts(css_class: str, font_size: Any, font_family: str,
+                                responsive_font_size: Any) -> Tuple[str, ...]:
+    """レスポンシブCSS設定を、HTMLチャンクへ直接展開できる断片のタプルとして生成"""
+    # CSS セレクターに . を追加（クラスセレクターとして正しく動作させるため）
+    css_selector = f".{css_class}" if not css_class.startswith('.') else css_class
+    
+    # テンプレート種別ごとの追加CSS設定（CSSクラス単位でキャッシュ）
+    additional_css = _get_responsive_additional_css(css_class)
+    
+    return (
+        '\n        ', css_selector, ' {\n'
+        '            font-size: ', str(responsive_font_size), 'vw;\n'
+        '            font-family: ', font_family, ', sans-serif;\n'
+        '        }\n'
+        '        \n'
+        '        /* デスクトップ表示での固定サイズ */\n'
+        '        @media (min-width: 768px) {\n'
+        '            ', css_selector, ' {\n'
+        '                font-size: ', str(font_size), 'px;', additional_css, '\n'
+        '            }\n'
+        '        }\n'
+        '        ',
+    )
+
+
+@lru_cache(maxsize=SKELETON_CACHE_MAX_SIZE)
+def _build_html_skeleton(required_plugins: Tuple[str, ...], css_class: str,
+                         font_size: Any, font_family: str, responsive_font_size: Any,
+                         template_category: str, template_name: str,
+                         external_css_links: Tuple[str, ...]) -> Dict[str, Any]:
+    """テンプレート・メタデータ単位で不変なHTML構成要素を生成（入力単位でキャッシュ）"""
+    return {
+        'base_css': HTMLTemplateBuilder.build_base_css_minimal(),
+        'ui_css': HTMLTemplateBuilder.build_ui_elements_css(),
+        # レスポンシブCSS設定（断片のままチャンクへ展開）
+        'responsive_css_parts': _build_responsive_css_parts(
+            css_class, font_size, font_family, responsive_font_size
+        ),
+        # プラグイン用の外部スクリプト参照を生成
+        'plugin_scripts': _build_plugin_script_tags(required_plugins),
+        # テンプレート用の外部CSS参照を生成
+        'template_css_links': (
+            _build_template_css_links(template_category, template_name, external_css_links)
+            if template_category and template_name else ""
+        ),
+    }
+
+
+@dataclass(frozen=True)
+class TemplateParts:
+    """HTML構築に必要なテンプレート固有要素"""
+    __slots__ = ('config', 'title', 'template_html', 'ui_html', 'css_class', 'data_count')
+    
+    config: TemplateConfig
+    title: str
+    template_html: str
+    ui_html: str
+    css_class: str
+    data_count: int
+
+
 class PluginConverterBase(ABC):
-    """プラグイン型ASS→HTML変換の共通基底クラス"""
+    """プラグイン型ASS→HTML変換の共通基底クラス
+    
+    インスタンス属性は __slots__ で宣言しているため、サブクラスは自身が追加する
+    属性をすべて __slots__ に列挙すること。列挙しない属性への代入は AttributeError
+    になる（サブクラスが __slots__ を宣言しない場合は __dict__ を持ち、制約はなくなる）。
+    """
+    
+    # インスタンス属性は__slots__で宣言（サブクラスも固有属性を__slots__で宣言する）
+    __slots__ = ('metadata', 'total_duration_ms', 'template_composer', 'file_deployer')
     
     def __init__(self):
         self.metadata: ASSMetadata = ASSMetadata()
@@ -37,6 +186,14 @@ class PluginConverterBase(ABC):
         """タイミングデータのJSON文字列を返す"""
         pass
     
+    def _get_timing_data_bytes(self) -> bytes:
+        """タイミングデータをUTF-8のJSONバイト列で返す
+        
+        既定ではJSON文字列をエンコードする。ペイロードが大きいテンプレートは
+        JSONUtils.dumps_bytes() で直接バイト列を生成するようオーバーライドする。
+        """
+        return self._get_timing_data_json().encode('utf-8')
+    
     @abstractmethod
     def _build_template_html(self) -> str:
         """テンプレート固有HTML"""
@@ -69,33 +226,65 @@ class PluginConverterBase(ABC):
     
     def read_ass_file_content(self, ass_file_path: str) -> str:
         """ASSファイルの内容を読み込む（共通処理）"""
-        with open(ass_file_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        # バイナリで一括読み込みしてデコード（TextIOWrapperの改行変換処理を経由しない）
+        with open(ass_file_path, 'rb') as f:
+            content = f.read().decode('utf-8')
+        
+        # テキストモードと同様に改行コードを正規化（CRを含む場合のみ）
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
     
     def remove_ass_tags(self, text_with_tags: str) -> str:
         """ASSタグを除去（統一処理）"""
-        return re.sub(r'\{[^}]*\}', '', text_with_tags).strip()
+        # タグを含まない行は正規表現エンジンを通さない
+        if '{' not in text_with_tags:
+            return text_with_tags.strip()
+        return ASS_TAG_PATTERN.sub('', text_with_tags).strip()
+    
+    def remove_ass_tags_bulk(self, texts_with_tags: List[str]) -> List[str]:
+        """複数行のASSタグを一括除去（行単位のメソッド呼び出しを省略）"""
+        sub = ASS_TAG_PATTERN.sub
+        return [(sub('', text) if '{' in text else text).strip() for text in texts_with_tags]
+    
+    def _collect_template_parts(self, data_count: int) -> TemplateParts:
+        """HTML構築に必要なテンプレート固有要素を一度にまとめて取得"""
+        return TemplateParts(
+            config=self.get_template_config(),
+            title=self._get_template_title(),
+            template_html=self._build_template_html(),
+            ui_html=self._build_ui_elements_html(),
+            css_class=self._get_responsive_css_class(),
+            data_count=data_count,
+        )
     
     def generate_html(self, output_path: str) -> None:
         """HTMLファイルを生成（共通処理）"""
-        if self._get_data_count() == 0:
+        # 解析データの有無を先に確認（空の場合はサブクラスのHTML構築処理を呼ばない）
+        data_count = self._get_data_count()
+        if data_count == 0:
             raise ValueError("解析データが未設定です。parse_ass_file()を先に実行してください。")
         
-        # プラグイン設定を取得
-        template_config = self.get_template_config()
+        # テンプレート固有要素を一括取得
+        parts = self._collect_template_parts(data_count)
         
-        # タイミングデータを取得
-        timing_data = self._get_timing_data_json()
+        # タイミングデータを取得（HTMLへはバイト列のまま埋め込む）
+        timing_data = self._get_timing_data_bytes()
         
         # 必要なアセットファイルを配信
         output_dir = os.path.dirname(output_path)
-        self._deploy_required_assets(output_dir, template_config)
+        self._deploy_required_assets(output_dir, parts.config)
         
         # HTMLコンテンツを構築（外部参照版）
-        html_content = self._build_html_content_with_external_js(template_config, timing_data)
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        html_chunks = self._build_html_content_with_external_js(parts, timing_data)
+        
+        # チャンクを連結せずにバッファ付きで一括書き込み（ピークメモリ削減）
+        # バイト列のチャンクはそのまま、文字列のチャンクのみUTF-8にエンコードする
+        with open(output_path, 'wb', buffering=HTML_WRITE_BUFFER_SIZE) as f:
+            f.writelines(
+                chunk if isinstance(chunk, bytes) else chunk.encode('utf-8')
+                for chunk in html_chunks
+            )
     
     def _build_html_content(self, composed_result: Dict[str, str]) -> str:
         """HTML/CSS/JavaScriptを統合したコンテンツを生成（共通処理）"""
@@ -137,63 +326,32 @@ class PluginConverterBase(ABC):
 </body>
 </html>"""
     
-    def _build_responsive_css(self) -> str:
+    def _build_responsive_css(self, css_class: Optional[str] = None) -> str:
         """レスポンシブCSS設定（共通処理）"""
-        css_class = self._get_responsive_css_class()
-        
-        # CSS セレクターに . を追加（クラスセレクターとして正しく動作させるため）
-        css_selector = f".{css_class}" if not css_class.startswith('.') else css_class
-        
-        # SimpleRoleの場合は追加のCSS設定
-        additional_css = ""
-        if "scroll" in css_class:
-            additional_css = """
-                max-width: 800px;
-                margin: 0 auto;"""
-        elif "railway" in css_class:
-            additional_css = """
-                max-width: 600px;"""
-        elif "typewriter" in css_class:
-            additional_css = """
-                max-width: 600px;"""
-        
-        return f"""
-        {css_selector} {{
-            font-size: {self.metadata.responsive_font_size}vw;
-            font-family: {self.metadata.font_family}, sans-serif;
-        }}
-        
-        /* デスクトップ表示での固定サイズ */
-        @media (min-width: 768px) {{
-            {css_selector} {{
-                font-size: {self.metadata.font_size}px;{additional_css}
-            }}
-        }}
-        """
+        return ''.join(self._build_responsive_css_parts(css_class))
+    
+    def _build_responsive_css_parts(self, css_class: Optional[str] = None) -> Tuple[str, ...]:
+        """レスポンシブCSS設定を、HTMLチャンクへ直接展開できる断片のタプルとして生成"""
+        if css_class is None:
+            css_class = self._get_responsive_css_class()
+        return _build_responsive_css_parts(
+            css_class, self.metadata.font_size, self.metadata.font_family,
+            self.metadata.responsive_font_size
+        )
     
     def _deploy_required_assets(self, output_dir: str, template_config: TemplateConfig) -> None:
         """必要なアセットファイルを配信"""
         try:
-            # 共通アセットを配信
-            self.file_deployer.deploy_shared_assets(output_dir)
-            
-            # 必要なプラグインファイルを配信
-            self.file_deployer.deploy_plugin_files(output_dir, template_config.required_plugins)
-            
-            # テンプレート固有アセットを配信
             template_category = self._get_template_category()
             template_name = self._get_template_name()
-            if template_category and template_name:
-                self.file_deployer.sync_template_assets(output_dir, template_category, template_name)
             
-            # アセットマニフェストを作成（オプショナル - 実際のHTML/JS動作には不要）
-            # 必要なシーン例:
-            # - CI/CDでのアセット配信検証
-            # - デバッグ時のアセット依存関係確認
-            # - 大規模プロジェクトでの配信履歴追跡
-            # - アセット配信失敗時のトラブルシューティング
-            # 不要な場合は以下をコメントアウト:
-            self.file_deployer.create_asset_manifest(output_dir)
+            # 共通アセット・プラグイン・テンプレート固有アセットを1回のコピー処理で配信し、
+            # 全配信完了後にアセットマニフェストを作成
+            # （マニフェストはオプショナル - 実際のHTML/JS動作には不要だが、
+            #   CI/CDでの配信検証やデバッグ時の依存関係確認に利用）
+            self.file_deployer.deploy_all(
+                output_dir, template_config.required_plugins, template_category, template_name
+            )
             
         except Exception as e:
             print(f"⚠️  アセット配信で警告: {e}")
@@ -206,116 +364,113 @@ class PluginConverterBase(ABC):
         if not template_category or not template_name:
             return ""
         
-        css_path = f"templates/{template_category}/{template_name}/sc-template.css"
-        links = [
-            '    <!-- Template Specific Styles -->',
-            f'    <link rel="stylesheet" href="{css_path}">'
-        ]
-        
         # 外部CSS設定から追加のリンクを取得
-        external_css_links = self._get_external_css_links()
-        if external_css_links:
-            links.extend(external_css_links)
+        external_css_links = tuple(self._get_external_css_links())
         
-        return '\n'.join(links)
+        return _build_template_css_links(template_category, template_name, external_css_links)
     
-    def _build_html_content_with_external_js(self, template_config: TemplateConfig, timing_data: str) -> str:
-        """外部JavaScript参照版のHTMLコンテンツを生成"""
-        title = HTMLTemplateBuilder.build_head(self._get_template_title())
-        base_css = HTMLTemplateBuilder.build_base_css_minimal()
-        ui_css = HTMLTemplateBuilder.build_ui_elements_css()
+    def _build_html_content_with_external_js(self, parts: TemplateParts,
+                                             timing_data: Union[str, bytes]) -> List[Union[str, bytes]]:
+        """外部JavaScript参照版のHTMLコンテンツをチャンクのリストとして生成
         
-        # レスポンシブCSS設定
-        responsive_css = self._build_responsive_css()
+        timing_data はバイト列のままチャンクに含め、書き込み時にそのまま出力する。
+        """
+        title = HTMLTemplateBuilder.build_head(parts.title)
         
-        template_html = self._build_template_html()
-        ui_html = self._build_ui_elements_html()
+        # テンプレート・メタデータ単位で不変な部分はキャッシュを利用
+        skeleton = self._get_html_skeleton(parts.config, parts.css_class)
+        base_css = skeleton['base_css']
+        ui_css = skeleton['ui_css']
+        responsive_css_parts = skeleton['responsive_css_parts']
+        plugin_scripts = skeleton['plugin_scripts']
+        template_css_links = skeleton['template_css_links']
         
-        # プラグイン用の外部スクリプト参照を生成
-        plugin_scripts = self._generate_plugin_script_tags(template_config.required_plugins)
-        
-        # テンプレート用の外部CSS参照を生成
-        template_css_links = self._generate_template_css_links()
+        template_html = parts.template_html
+        ui_html = parts.ui_html
         
         # テンプレート設定をJSON化
-        import json
-        config_json = json.dumps(template_config.to_dict(), ensure_ascii=False, indent=4)
-        
-        return f"""<!DOCTYPE html>
-<html lang="ja">
-{title}
-    <!-- ScrollCast Shared Styles -->
-    <link rel="stylesheet" href="lib/scrollcast-styles.css">
-{template_css_links}
-    <style>
-{base_css}
-        
-{responsive_css}
-        
-{ui_css}
-    </style>
-</head>
-<body>
-{template_html}
-    
-{ui_html}
+        config_json = JSONUtils.dumps(parts.config.to_dict())
+        
+        return [
+            '<!DOCTYPE html>\n<html lang="ja">\n',
+            title,
+            '\n    <!-- ScrollCast Shared Styles -->'
+            '\n    <link rel="stylesheet" href="lib/scrollcast-styles.css">\n',
+            template_css_links,
+            '\n    <style>\n',
+            base_css,
+            '\n        \n',
+            *responsive_css_parts,
+            '\n        \n',
+            ui_css,
+            '\n    </style>\n</head>\n<body>\n',
+            template_html,
+            '\n    \n',
+            ui_html,
+            '\n    \n'
+            '    <!-- ScrollCast Core Library -->\n'
+            '    <script src="lib/scrollcast-core.js"></script>\n',
+            plugin_scripts,
+            '\n    \n'
+            '    <script>\n'
+            '        // Template Integration Layer\n'
+            "        document.addEventListener('DOMContentLoaded', function() {\n"
+            '            // タイミングデータ\n'
+            '            const timingData = ',
+            timing_data,
+            ';\n'
+            '            \n'
+            '            // テンプレート設定\n'
+            '            const templateConfig = ',
+            config_json,
+            ';\n'
+            '            templateConfig.timingData = timingData;\n'
+            '            \n'
+            '            // ScrollCastコアで全プラグインを初期化\n'
+            '            if (window.ScrollCastCore) {\n'
+            '                window.ScrollCastCore.initializePlugins(templateConfig);\n'
+            '            }\n'
+            '        });\n'
+            '    </script>\n'
+            '</body>\n'
+            '</html>',
+        ]
     
-    <!-- ScrollCast Core Library -->
-    <script src="lib/scrollcast-core.js"></script>
-{plugin_scripts}
+    def _get_html_skeleton(self, template_config: TemplateConfig, css_class: str) -> Dict[str, Any]:
+        """テンプレート・メタデータ単位で不変なHTML構成要素を取得（外部CSS設定も含めてキャッシュ）"""
+        return _build_html_skeleton(
+            tuple(template_config.required_plugins),
+            css_class,
+            self.metadata.font_size,
+            self.metadata.font_family,
+            self.metadata.responsive_font_size,
+            self._get_template_category(),
+            self._get_template_name(),
+            tuple(self._get_external_css_links()),
+        )
     
-    <script>
-        // Template Integration Layer
-        document.addEventListener('DOMContentLoaded', function() {{
-            // タイミングデータ
-            const timingData = {timing_data};
-            
-            // テンプレート設定
-            const templateConfig = {config_json};
-            templateConfig.timingData = timingData;
-            
-            // ScrollCastコアで全プラグインを初期化
-            if (window.ScrollCastCore) {{
-                window.ScrollCastCore.initializePlugins(templateConfig);
-            }}
-        }});
-    </script>
-</body>
-</html>"""
+    @classmethod
+    def clear_skeleton_cache(cls) -> None:
+        """HTML構成要素キャッシュをクリア"""
+        _build_html_skeleton.cache_clear()
     
     def _generate_plugin_script_tags(self, required_plugins: list) -> str:
         """プラグイン用のスクリプトタグを生成"""
-        script_tags = []
-        for plugin_name in required_plugins:
-            plugin_file = f"{plugin_name.replace('_', '-')}-plugin.js"
-            script_tags.append(f'    <script src="plugins/{plugin_file}"></script>')
-        return '\n'.join(script_tags)
+        return _build_plugin_script_tags(tuple(required_plugins))
+    
+    def _get_template_asset_ids(self) -> Tuple[str, str]:
+        """(テンプレートカテゴリ, テンプレートディレクトリ名) を取得"""
+        template_name = self.get_template_config().template_name
+        # 未登録のテンプレートはカテゴリなし・元のテンプレート名を返す
+        return TEMPLATE_ASSET_IDS.get(template_name, ("", template_name))
     
     def _get_template_category(self) -> str:
         """テンプレートカテゴリを取得（サブクラスでオーバーライド）"""
-        template_name = self.get_template_config().template_name
-        if "typewriter" in template_name:
-            return "typewriter"
-        elif "railway" in template_name:
-            return "railway"
-        elif "simple_role" in template_name:
-            return "scroll"
-        return ""
+        return self._get_template_asset_ids()[0]
     
     def _get_template_name(self) -> str:
         """テンプレート名を取得（サブクラスでオーバーライド）"""
-        template_name = self.get_template_config().template_name
-        if template_name == "typewriter_fade":
-            return "typewriter_fade"
-        elif template_name == "railway_scroll":
-            return "railway_scroll"
-        elif template_name == "simple_role":
-            return "scroll_role"
-        elif template_name == "revolver_up":
-            return "revolver_up"
-        else:
-            # デフォルトとして元のテンプレート名を返す
-            return template_name
+        return self._get_template_asset_ids()[1]
     
     def _load_external_css_config(self) -> Dict[str, Any]:
         """外部CSS設定ファイルを読み込む"""
@@ -327,8 +482,8 @@ class PluginConverterBase(ABC):
         )
         
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+            # 更新時刻をキーにキャッシュ（ファイル変更時のみ再読み込み）
+            return _load_yaml_file_cached(config_path, os.path.getmtime(config_path))
         except (FileNotFoundError, yaml.YAMLError) as e:
             print(f"⚠️  外部CSS設定読み込み警告: {e}")
             return {}
@@ -363,10 +518,13 @@ class PluginConverterBase(ABC):
         self.parse_ass_file(ass_file_path)
         self.generate_html(html_output_path)
         
+        # ログは1回の書き込みにまとめて出力（行ごとのロック・フラッシュを回避）
         template_name = self._get_print_template_name()
-        print(f"✅ {template_name} ASS→HTML変換完了:")
-        print(f"   入力: {ass_file_path}")
-        print(f"   出力: {html_output_path}")
-        print(f"   総時間: {self.total_duration_ms}ms")
-        print(f"   要素数: {self._get_data_count()}")
-        print(f"   プラグイン: {', '.join(self.get_template_config().required_plugins)}")
\ No newline at end of file
+        sys.stdout.write(
+            f"✅ {template_name} ASS→HTML変換完了:\n"
+            f"   入力: {ass_file_path}\n"
+            f"   出力: {html_output_path}\n"
+            f"   総時間: {self.total_duration_ms}ms\n"
+            f"   要素数: {self._get_data_count()}\n"
+            f"   プラグイン: {', '.join(self.get_template_config().required_plugins)}\n"
+        )
\ No newline at end of file
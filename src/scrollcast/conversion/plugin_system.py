@@ -5,33 +5,74 @@ Plugin-based template system for scalable interaction implementation
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any, Tuple, Type, Union
+import io
 import json
+import sys
+import textwrap
 
+from .utils import JSONUtils
 
-@dataclass
+# プラグイン初期化コードのテンプレート
+PLUGIN_INIT_TEMPLATE = """
+            if (window.{global_name}) {{
+                window.{global_name}.initialize({{
+                    ...templateConfig,{timing_data_entry}
+                    ...{config_json}
+                }});
+            }}"""
+
+# 自動再生プラグインにのみ渡すタイミングデータ引数
+PLUGIN_INIT_TIMING_DATA_ENTRY = "\n                    timingData,"
+
+# sequence_start購読ヘルパー（AutoPlayPluginが無い場合はwindowイベントで受信）
+SEQUENCE_SUBSCRIBE_HELPER = """
+            const subscribeSequenceStart = (handler) => {
+                if (window.AutoPlayPlugin && window.AutoPlayPlugin.onSequenceStart) {
+                    window.AutoPlayPlugin.onSequenceStart(handler);
+                } else {
+                    window.addEventListener('sequence_start', (event) => handler(event.detail));
+                }
+            };"""
+
+# 表示プラグインのsequence_startハンドラー購読コードのテンプレート
+PLUGIN_SEQUENCE_BINDING_TEMPLATE = """
+            if (window.{global_name}) {{
+                subscribeSequenceStart((detail) => window.{global_name}.handleSequenceStart(detail));
+            }}"""
+
+
+@dataclass(frozen=True)
 class PluginConfig:
-    """プラグイン設定"""
+    """プラグイン設定（不変・ハッシュ可能）"""
     name: str
     version: str = "1.0.0"
-    dependencies: List[str] = field(default_factory=list)
-    config_params: Dict[str, Any] = field(default_factory=dict)
+    dependencies: Tuple[str, ...] = ()
+    config_params: Dict[str, Any] = field(default_factory=dict, hash=False)
+    
+    def __post_init__(self):
+        # リスト指定も受け付け、内部ではタプルとして保持
+        object.__setattr__(self, 'dependencies', tuple(self.dependencies))
 
 
-@dataclass
+@dataclass(frozen=True)
 class TemplateConfig:
-    """テンプレート設定"""
+    """テンプレート設定（不変・ハッシュ可能）"""
     template_name: str
     navigation_unit: str  # "sentence", "line", "paragraph"
-    required_plugins: List[str] = field(default_factory=list)
-    plugin_configs: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    required_plugins: Tuple[str, ...] = ()
+    plugin_configs: Dict[str, Dict[str, Any]] = field(default_factory=dict, hash=False)
+    
+    def __post_init__(self):
+        # リスト指定も受け付け、内部ではタプルとして保持
+        object.__setattr__(self, 'required_plugins', tuple(self.required_plugins))
     
     def to_dict(self) -> Dict[str, Any]:
         """設定をJSON化可能な辞書に変換"""
         return {
             "template_name": self.template_name,
             "navigation_unit": self.navigation_unit,
-            "required_plugins": self.required_plugins,
+            "required_plugins": list(self.required_plugins),
             "plugin_configs": self.plugin_configs
         }
 
@@ -39,24 +80,45 @@ class TemplateConfig:
 class InteractionPlugin(ABC):
     """インタラクションプラグインの基底クラス"""
     
+    # JS側にhandleSequenceStartを持ち、初期化時にsequence_startを購読するか
+    handles_sequence_start: bool = False
+    
     def __init__(self, config: PluginConfig):
         self.config = config
         self.name = config.name
         self.dependencies = config.dependencies
+        # JavaScript側のグローバル変数名 (auto_play -> AutoPlayPlugin)
+        self.global_name = f"{''.join(word.capitalize() for word in config.name.split('_'))}Plugin"
+        self._cached_js: Optional[str] = None
+        self._cached_css: Optional[str] = None
     
     @abstractmethod
-    def get_javascript_module(self) -> str:
-        """JavaScriptモジュールコードを返す"""
+    def _build_javascript_module(self) -> str:
+        """JavaScriptモジュールコードを生成"""
         pass
     
     @abstractmethod
-    def get_css_styles(self) -> str:
-        """CSSスタイルを返す"""
+    def _build_css_styles(self) -> str:
+        """CSSスタイルを生成"""
         pass
     
-    def validate_dependencies(self, available_plugins: List[str]) -> bool:
+    def get_javascript_module(self) -> str:
+        """JavaScriptモジュールコードを返す（インデント除去後、インスタンス単位でキャッシュ）"""
+        if self._cached_js is None:
+            self._cached_js = sys.intern(textwrap.dedent(self._build_javascript_module()))
+        return self._cached_js
+    
+    def get_css_styles(self) -> str:
+        """CSSスタイルを返す（インデント除去後、インスタンス単位でキャッシュ）"""
+        if self._cached_css is None:
+            self._cached_css = sys.intern(textwrap.dedent(self._build_css_styles()))
+        return self._cached_css
+    
+    def validate_dependencies(self, available_plugins: Iterable[str]) -> bool:
         """依存関係の検証"""
-        return all(dep in available_plugins for dep in self.dependencies)
+        if not isinstance(available_plugins, (set, frozenset)):
+            available_plugins = set(available_plugins)
+        return available_plugins.issuperset(self.dependencies)
 
 
 class AutoPlayPlugin(InteractionPlugin):
@@ -65,10 +127,12 @@ class AutoPlayPlugin(InteractionPlugin):
     def __init__(self, config: PluginConfig):
         super().__init__(config)
     
-    def get_javascript_module(self) -> str:
+    def _build_javascript_module(self) -> str:
         return """
         window.AutoPlayPlugin = {
             name: 'auto_play',
+            // sequence_start購読者（DOMイベントを介さず直接呼び出す）
+            _seqHandlers: [],
             
             initialize: function(config) {
                 this.config = config;
@@ -78,6 +142,7 @@ class AutoPlayPlugin(InteractionPlugin):
                     startTime: null
                 };
                 this.timeline = [];
+                this.nextEventIdx = 0;
                 this.setupTimeline();
                 this.setupAutoPlay();
             },
@@ -98,8 +163,13 @@ class AutoPlayPlugin(InteractionPlugin):
                     });
                 });
                 
-                // 総時間を最後の要素の終了時間で計算
-                if (this.config.timingData.length > 0) {
+                // カーソル走査のため時刻順に整列
+                this.timeline.sort((a, b) => a.time - b.time);
+                
+                // 総時間はPython側で事前計算済みの値を優先
+                if (this.config.totalDuration !== undefined) {
+                    this.totalDuration = this.config.totalDuration;
+                } else if (this.config.timingData.length > 0) {
                     const lastSequence = this.config.timingData[this.config.timingData.length - 1];
                     const lastStartTime = lastSequence.start_time || 0;
                     const lastDuration = lastSequence.duration || 8000;
@@ -144,20 +214,25 @@ class AutoPlayPlugin(InteractionPlugin):
             },
             
             processTimelineEvents: function(currentTime) {
-                // 未実行のイベントを検索して実行
-                this.timeline.forEach(event => {
-                    if (!event.executed && currentTime >= event.time) {
-                        event.executed = true;
-                        
-                        if (event.type === 'sequence_start') {
-                            this.dispatchEvent('sequence_start', {
-                                index: event.index,
-                                data: event.data,
-                                globalTime: currentTime
-                            });
-                        }
+                // 到達済みのイベントだけカーソルを進めて実行
+                while (this.nextEventIdx < this.timeline.length &&
+                       currentTime >= this.timeline[this.nextEventIdx].time) {
+                    const event = this.timeline[this.nextEventIdx++];
+                    
+                    if (event.type === 'sequence_start') {
+                        const detail = {
+                            index: event.index,
+                            data: event.data,
+                            globalTime: currentTime,
+                            source: 'auto_play'
+                        };
+                        this._seqHandlers.forEach(handler => handler(detail));
                     }
-                });
+                }
+            },
+            
+            onSequenceStart: function(handler) {
+                this._seqHandlers.push(handler);
             },
             
             dispatchEvent: function(eventType, detail = {}) {
@@ -175,7 +250,7 @@ class AutoPlayPlugin(InteractionPlugin):
         };
         """
     
-    def get_css_styles(self) -> str:
+    def _build_css_styles(self) -> str:
         return """
         /* Auto Play Plugin Styles */
         .auto-play-indicator {
@@ -195,10 +270,12 @@ class AutoPlayPlugin(InteractionPlugin):
 class TypewriterDisplayPlugin(InteractionPlugin):
     """Web Animation API ベースタイプライター表示プラグイン"""
     
+    handles_sequence_start = True
+    
     def __init__(self, config: PluginConfig):
         super().__init__(config)
     
-    def get_javascript_module(self) -> str:
+    def _build_javascript_module(self) -> str:
         return """
         window.TypewriterDisplayPlugin = {
             name: 'typewriter_display',
@@ -206,23 +283,22 @@ class TypewriterDisplayPlugin(InteractionPlugin):
             initialize: function(config) {
                 this.config = config;
                 this.sentences = document.querySelectorAll('.typewriter-sentence');
+                // 文ごとの文字要素を一度だけ取得してキャッシュ
+                this.sentenceChars = Array.from(this.sentences, sentence => sentence.querySelectorAll('.typewriter-char'));
                 this.currentSentenceIndex = 0;
-                this.setupDisplayHandlers();
                 this.initializeDisplay();
             },
             
-            setupDisplayHandlers: function() {
-                // シンプル自動再生イベントのリスナー
-                window.addEventListener('sequence_start', (event) => {
-                    this.playSequence(event.detail.index, event.detail.data);
-                });
+            // sequence_start ハンドラー（購読はテンプレート初期化コードが行う）
+            handleSequenceStart: function(detail) {
+                this.playSequence(detail.index, detail.data);
             },
             
             initializeDisplay: function() {
                 // 全ての文を非表示に初期化
                 this.sentences.forEach((sentence, index) => {
                     sentence.classList.remove('active');
-                    const chars = sentence.querySelectorAll('.typewriter-char');
+                    const chars = this.sentenceChars[index];
                     chars.forEach(char => {
                         char.style.opacity = '0';
                     });
@@ -247,7 +323,7 @@ class TypewriterDisplayPlugin(InteractionPlugin):
             },
             
             animateCharactersWithWebAPI: function(sentence, sequenceData, sequenceIndex) {
-                const chars = sentence.querySelectorAll('.typewriter-char');
+                const chars = this.sentenceChars[sequenceIndex];
                 
                 // 既存の文を非表示
                 if (this.currentSentenceIndex < this.sentences.length && this.currentSentenceIndex !== sequenceIndex) {
@@ -289,7 +365,7 @@ class TypewriterDisplayPlugin(InteractionPlugin):
         };
         """
     
-    def get_css_styles(self) -> str:
+    def _build_css_styles(self) -> str:
         return """
         /* Typewriter Display Plugin Styles */
         .typewriter-container {
@@ -333,10 +409,12 @@ class TypewriterDisplayPlugin(InteractionPlugin):
 class SimpleRoleDisplayPlugin(InteractionPlugin):
     """シンプルロール表示プラグイン（映画エンドロール風）"""
     
+    handles_sequence_start = True
+    
     def __init__(self, config: PluginConfig):
         super().__init__(config)
     
-    def get_javascript_module(self) -> str:
+    def _build_javascript_module(self) -> str:
         return """
         window.SimpleRoleDisplayPlugin = {
             name: 'simple_role_display',
@@ -349,7 +427,6 @@ class SimpleRoleDisplayPlugin(InteractionPlugin):
                 };
                 this.totalLines = 0;
                 this.setupDisplay();
-                this.setupEventListeners();
             },
             
             setupDisplay: function() {
@@ -370,17 +447,18 @@ class SimpleRoleDisplayPlugin(InteractionPlugin):
                 }
             },
             
-            setupEventListeners: function() {
-                // シンプル自動再生イベント
-                window.addEventListener('sequence_start', (event) => {
-                    this.showLine(event.detail.index);
-                });
+            // sequence_start ハンドラー（購読はテンプレート初期化コードが行う）
+            handleSequenceStart: function(detail) {
+                this.showLine(detail.index);
             },
             
             showLine: function(lineIndex) {
                 if (lineIndex < 0 || lineIndex >= this.totalLines) return;
                 
-                console.log(`[SimpleRole] Showing line ${lineIndex}:`, this.lineElements[lineIndex]?.textContent);
+                // デバッグ時のみログ出力（DOM読み取りとコンソール出力を省略）
+                if (this.config.debug) {
+                    console.log(`[SimpleRole] Showing line ${lineIndex}:`, this.lineElements[lineIndex]?.textContent);
+                }
                 
                 // 前の行は隠さない（連続表示）
                 
@@ -423,7 +501,7 @@ class SimpleRoleDisplayPlugin(InteractionPlugin):
         };
         """
     
-    def get_css_styles(self) -> str:
+    def _build_css_styles(self) -> str:
         return """
         /* Simple Role Display Plugin Styles */
         .role-container {
@@ -471,27 +549,75 @@ class PluginRegistry:
     
     def __init__(self):
         self.plugins: Dict[str, InteractionPlugin] = {}
+        self._lazy_plugins: Dict[str, Tuple[Type[InteractionPlugin], PluginConfig]] = {}
+        # プラグイン名の並び -> 検証済みプラグインリスト（失敗時はエラーメッセージ）
+        self._validated_orders: Dict[Tuple[str, ...], Union[List[InteractionPlugin], str]] = {}
     
     def register_plugin(self, plugin: InteractionPlugin):
         """プラグインを登録"""
+        self._lazy_plugins.pop(plugin.name, None)
         self.plugins[plugin.name] = plugin
+        self._validated_orders.clear()
+    
+    def register_lazy(self, plugin_class: Type[InteractionPlugin], config: PluginConfig):
+        """プラグインを遅延登録（初回取得時にインスタンス化）"""
+        if config.name not in self.plugins:
+            self._lazy_plugins[config.name] = (plugin_class, config)
+            self._validated_orders.clear()
     
     def get_plugin(self, name: str) -> Optional[InteractionPlugin]:
         """プラグインを取得"""
-        return self.plugins.get(name)
+        plugin = self.plugins.get(name)
+        if plugin is None and name in self._lazy_plugins:
+            plugin_class, config = self._lazy_plugins.pop(name)
+            plugin = plugin_class(config)
+            self.plugins[name] = plugin
+        return plugin
     
     def get_available_plugins(self) -> List[str]:
         """利用可能なプラグイン名一覧"""
-        return list(self.plugins.keys())
+        return list(self.plugins.keys()) + list(self._lazy_plugins.keys())
+    
+    def resolve_plugins(self, plugin_names: Tuple[str, ...]) -> List[InteractionPlugin]:
+        """プラグインを取得して依存関係を検証（結果は組み合わせ単位でキャッシュ）"""
+        resolved = self._validated_orders.get(plugin_names)
+        if resolved is None:
+            try:
+                resolved = self._resolve_and_validate(plugin_names)
+            except ValueError as e:
+                resolved = str(e)
+            self._validated_orders[plugin_names] = resolved
+        if isinstance(resolved, str):
+            raise ValueError(resolved)
+        return list(resolved)
+    
+    def _resolve_and_validate(self, plugin_names: Tuple[str, ...]) -> List[InteractionPlugin]:
+        """プラグインの取得と依存関係の検証"""
+        plugins = []
+        for plugin_name in plugin_names:
+            plugin = self.get_plugin(plugin_name)
+            if plugin:
+                plugins.append(plugin)
+            else:
+                raise ValueError(f"Required plugin '{plugin_name}' not found")
+        
+        available_plugin_names = {p.name for p in plugins}
+        for plugin in plugins:
+            if not plugin.validate_dependencies(available_plugin_names):
+                raise ValueError(f"Plugin '{plugin.name}' dependencies not satisfied")
+        
+        return plugins
 
 
 class RailwayDisplayPlugin(InteractionPlugin):
     """Web Animation API ベース鉄道方向幕風表示プラグイン"""
     
+    handles_sequence_start = True
+    
     def __init__(self, config: PluginConfig):
         super().__init__(config)
     
-    def get_javascript_module(self) -> str:
+    def _build_javascript_module(self) -> str:
         return """
         window.RailwayDisplayPlugin = {
             name: 'railway_display',
@@ -501,15 +627,12 @@ class RailwayDisplayPlugin(InteractionPlugin):
                 this.lines = document.querySelectorAll('.text-line');
                 this.currentLineIndex = 0;
                 this.activeAnimations = new Map();
-                this.setupDisplayHandlers();
                 this.initializeDisplay();
             },
             
-            setupDisplayHandlers: function() {
-                // シンプル自動再生イベントのリスナー
-                window.addEventListener('sequence_start', (event) => {
-                    this.playSequence(event.detail.index, event.detail.data);
-                });
+            // sequence_start ハンドラー（購読はテンプレート初期化コードが行う）
+            handleSequenceStart: function(detail) {
+                this.playSequence(detail.index, detail.data);
             },
             
             initializeDisplay: function() {
@@ -592,29 +715,7 @@ class RailwayDisplayPlugin(InteractionPlugin):
                         }
                     },
                     
-                    // Phase 2: 静止表示 (中央)
-                    {
-                        name: 'static',
-                        keyframes: [
-                            { 
-                                opacity: 1, 
-                                transform: 'translate(-50%, -50%) translateY(0px)',
-                                offset: 0 
-                            },
-                            { 
-                                opacity: 1, 
-                                transform: 'translate(-50%, -50%) translateY(0px)',
-                                offset: 1 
-                            }
-                        ],
-                        options: {
-                            duration: staticDuration,
-                            delay: staticStart,
-                            fill: 'forwards',
-                            easing: 'linear'
-                        }
-                    },
-                    
+                    // 静止表示はPhase 1のfill: 'forwards'で保持し、Phase 3を遅延開始
                     // Phase 3: フェードアウト (中央→上)
                     {
                         name: 'fade-out',
@@ -647,7 +748,7 @@ class RailwayDisplayPlugin(InteractionPlugin):
         };
         """
     
-    def get_css_styles(self) -> str:
+    def _build_css_styles(self) -> str:
         return """
         /* Railway Display Plugin Styles */
         .railway-container {
@@ -704,34 +805,22 @@ class TemplateComposer:
         self._register_default_plugins()
     
     def _register_default_plugins(self):
-        """デフォルトプラグインを登録（シンプルテキストフロー版）"""
+        """デフォルトプラグインを遅延登録（シンプルテキストフロー版）"""
         auto_play_config = PluginConfig(name="auto_play", dependencies=[])
         typewriter_config = PluginConfig(name="typewriter_display", dependencies=["auto_play"])
         railway_config = PluginConfig(name="railway_display", dependencies=["auto_play"])
         simple_role_config = PluginConfig(name="simple_role_display", dependencies=["auto_play"])
         
-        self.plugin_registry.register_plugin(AutoPlayPlugin(auto_play_config))
-        self.plugin_registry.register_plugin(TypewriterDisplayPlugin(typewriter_config))
-        self.plugin_registry.register_plugin(RailwayDisplayPlugin(railway_config))
-        self.plugin_registry.register_plugin(SimpleRoleDisplayPlugin(simple_role_config))
+        self.plugin_registry.register_lazy(AutoPlayPlugin, auto_play_config)
+        self.plugin_registry.register_lazy(TypewriterDisplayPlugin, typewriter_config)
+        self.plugin_registry.register_lazy(RailwayDisplayPlugin, railway_config)
+        self.plugin_registry.register_lazy(SimpleRoleDisplayPlugin, simple_role_config)
     
     def compose_template(self, template_config: TemplateConfig, timing_data: str) -> Dict[str, str]:
         """設定に基づいてプラグインを組み立て"""
         
-        # 必要なプラグインを取得
-        required_plugins = []
-        for plugin_name in template_config.required_plugins:
-            plugin = self.plugin_registry.get_plugin(plugin_name)
-            if plugin:
-                required_plugins.append(plugin)
-            else:
-                raise ValueError(f"Required plugin '{plugin_name}' not found")
-        
-        # 依存関係の検証
-        available_plugin_names = [p.name for p in required_plugins]
-        for plugin in required_plugins:
-            if not plugin.validate_dependencies(available_plugin_names):
-                raise ValueError(f"Plugin '{plugin.name}' dependencies not satisfied")
+        # 必要なプラグインを取得・依存関係を検証（レジストリ側でキャッシュ）
+        required_plugins = self.plugin_registry.resolve_plugins(template_config.required_plugins)
         
         # JavaScript/CSSを統合
         composed_js = self._compose_javascript_modules(required_plugins, template_config, timing_data)
@@ -745,7 +834,7 @@ class TemplateComposer:
     def _compose_javascript_modules(self, plugins: List[InteractionPlugin], 
                                    config: TemplateConfig, timing_data: str) -> str:
         """JavaScriptモジュールを統合"""
-        modules = []
+        buffer = io.StringIO()
         
         # 共有ライブラリに含まれるプラグインをスキップ（シンプル版はインタラクションなし）
         shared_plugins = ['auto_play']
@@ -753,8 +842,13 @@ class TemplateComposer:
         # プラグインモジュール（共有プラグイン以外のみ）
         for plugin in plugins:
             if plugin.name not in shared_plugins:
-                modules.append(f"// {plugin.name} Plugin")
-                modules.append(plugin.get_javascript_module())
+                buffer.write(f"// {plugin.name} Plugin\n\n")
+                buffer.write(plugin.get_javascript_module())
+                buffer.write("\n\n")
+        
+        # 総再生時間を事前計算（クライアント側のループを省略）
+        total_duration = self._calculate_total_duration(timing_data)
+        total_duration_js = "" if total_duration is None else f"            templateConfig.totalDuration = {total_duration};"
         
         # 統合レイヤー
         integration_layer = f"""
@@ -764,8 +858,8 @@ class TemplateComposer:
             const timingData = {timing_data};
             
             // テンプレート設定
-            const templateConfig = {json.dumps(config.to_dict())};
-            templateConfig.timingData = timingData;
+            const templateConfig = {JSONUtils.dumps(config.to_dict())};
+{total_duration_js}
             
             // プラグイン初期化
             {self._generate_plugin_initialization(plugins, config)}
@@ -774,50 +868,66 @@ class TemplateComposer:
             window.TemplateController = {{
                 config: templateConfig,
                 plugins: {{
-                    {', '.join([f'{p.name}: window.{self._get_plugin_global_name(p)}' for p in plugins])}
+                    {', '.join([f'{p.name}: window.{p.global_name}' for p in plugins])}
                 }}
             }};
         }});
         """
         
-        modules.append(integration_layer)
-        return "\n\n".join(modules)
+        buffer.write(integration_layer)
+        return buffer.getvalue()
+    
+    def _calculate_total_duration(self, timing_data: str) -> Optional[int]:
+        """最後のシーケンスの開始時間+長さから総再生時間を計算（算出できない場合はNone）"""
+        try:
+            sequences = json.loads(timing_data)
+        except ValueError:
+            return None
+        if not isinstance(sequences, list):
+            return None
+        if not sequences:
+            return 0
+        last_sequence = sequences[-1]
+        if not isinstance(last_sequence, dict):
+            return None
+        return (last_sequence.get('start_time') or 0) + (last_sequence.get('duration') or 8000)
     
     def _compose_css_modules(self, plugins: List[InteractionPlugin], 
                            config: TemplateConfig) -> str:
         """CSSモジュールを統合"""
-        css_modules = []
+        buffer = io.StringIO()
         
         # 共有ライブラリに含まれるプラグインをスキップ（シンプル版はインタラクションなし）
         shared_plugins = ['auto_play']
         
         for plugin in plugins:
             if plugin.name not in shared_plugins:
-                css_modules.append(f"/* {plugin.name} Plugin Styles */")
-                css_modules.append(plugin.get_css_styles())
+                if buffer.tell():
+                    buffer.write("\n\n")
+                buffer.write(f"/* {plugin.name} Plugin Styles */\n\n")
+                buffer.write(plugin.get_css_styles())
         
-        return "\n\n".join(css_modules)
+        return buffer.getvalue()
     
     def _generate_plugin_initialization(self, plugins: List[InteractionPlugin], 
                                       config: TemplateConfig) -> str:
         """プラグイン初期化コードを生成"""
-        init_code = []
-        
-        for plugin in plugins:
-            global_name = self._get_plugin_global_name(plugin)
-            plugin_config = config.plugin_configs.get(plugin.name, {})
-            
-            init_code.append(f"""
-            if (window.{global_name}) {{
-                window.{global_name}.initialize({{
-                    ...templateConfig,
-                    ...{json.dumps(plugin_config)}
-                }});
-            }}""")
+        # タイミングデータはそれを消費する自動再生プラグインにのみ渡す
+        blocks = [
+            PLUGIN_INIT_TEMPLATE.format(
+                global_name=plugin.global_name,
+                timing_data_entry=PLUGIN_INIT_TIMING_DATA_ENTRY if plugin.name == 'auto_play' else "",
+                config_json=JSONUtils.dumps(config.plugin_configs.get(plugin.name, {}))
+            )
+            for plugin in plugins
+        ]
         
-        return "\n".join(init_code)
-    
-    def _get_plugin_global_name(self, plugin: InteractionPlugin) -> str:
-        """プラグインのグローバル変数名を取得"""
-        # auto_play -> AutoPlayPlugin
-        return f"{''.join(word.capitalize() for word in plugin.name.split('_'))}Plugin"
\ No newline at end of file
+        # 表示プラグインのsequence_start購読は全プラグインの初期化後に行う
+        subscribers = [plugin for plugin in plugins if plugin.handles_sequence_start]
+        if subscribers:
+            blocks.append(SEQUENCE_SUBSCRIBE_HELPER)
+            blocks.extend(
+                PLUGIN_SEQUENCE_BINDING_TEMPLATE.format(global_name=plugin.global_name)
+                for plugin in subscribers
+            )
+        return "\n".join(blocks)
\ No newline at end of file
@@ -3,11 +3,12 @@ RailwayScroll Plugin-based ASS to HTML converter
 プラグイン型RailwayScrollテンプレート実装
 """
 
-import json
-from typing import List, Tuple, NamedTuple
-from .utils import ASSTimeUtils, ASSMetadataExtractor, ASSDialogueParser
+import os
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional, Tuple, NamedTuple
+from .utils import ASSTimeUtils, ASSMetadataExtractor, ASSDialogueStream, HTMLTemplateBuilder, JSONUtils, escape_text
 from .plugin_system import TemplateConfig
-from .plugin_converter_base import PluginConverterBase
+from .plugin_converter_base import PluginConverterBase, _load_text_file_cached
 
 
 class RailwayScrollTiming(NamedTuple):
@@ -25,6 +26,8 @@ class RailwayScrollTiming(NamedTuple):
 class RailwayScrollPluginConverter(PluginConverterBase):
     """プラグイン型RailwayScroll ASS→HTML変換クラス"""
     
+    __slots__ = ('line_timings',)
+    
     def __init__(self):
         super().__init__()
         self.line_timings: List[RailwayScrollTiming] = []
@@ -54,43 +57,37 @@ class RailwayScrollPluginConverter(PluginConverterBase):
         # メタデータ抽出
         self.metadata = ASSMetadataExtractor.extract_metadata(content, "Railway_Scroll")
         
-        # Dialogue行の抽出と総時間計算
-        dialogue_matches = ASSDialogueParser.parse_dialogues(content)
-        self.total_duration_ms = ASSDialogueParser.calculate_total_duration(dialogue_matches)
+        # Dialogue行の解析と総時間計算
+        dialogue_stream = ASSDialogueStream(content)
+        self._parse_railway_scroll_layers(dialogue_stream)
+        self.total_duration_ms = dialogue_stream.total_duration_ms
         self.metadata.total_duration_ms = self.total_duration_ms
-        
-        # RailwayScroll固有のタイミング解析
-        self._parse_railway_scroll_layers(dialogue_matches)
     
-    def _parse_railway_scroll_layers(self, dialogue_matches: List[Tuple[str, str, str, str]]) -> None:
+    def _parse_railway_scroll_layers(self, dialogue_matches: Iterable[Tuple[str, str, str, str]]) -> None:
         """Railway_Scrollの3層レイヤー構造を解析"""
-        # テキストごとにレイヤー情報をグループ化
-        text_groups = {}
+        # テキストごとに3層分の (start_ms, end_ms) をグループ化
+        text_groups: Dict[str, List[Optional[Tuple[int, int]]]] = {}
         
         for layer, start_time, end_time, text_with_tags in dialogue_matches:
             # テキスト内容を抽出（ASSタグを除去）
             text_content = self.remove_ass_tags(text_with_tags)
-            
             if not text_content:
                 continue
             
             layer_num = int(layer)
-            start_ms = ASSTimeUtils.to_milliseconds(start_time)
-            end_ms = ASSTimeUtils.to_milliseconds(end_time)
-            
-            if text_content not in text_groups:
-                text_groups[text_content] = {}
+            if layer_num > 2:
+                continue
             
-            text_groups[text_content][layer_num] = {
-                'start_ms': start_ms,
-                'end_ms': end_ms,
-                'tags': text_with_tags
-            }
+            slot = text_groups.setdefault(text_content, [None, None, None])
+            slot[layer_num] = (
+                ASSTimeUtils.to_milliseconds(start_time),
+                ASSTimeUtils.to_milliseconds(end_time)
+            )
         
         # 各テキストの3層タイミングを統合
         line_number = 0
         for text_content, layers in text_groups.items():
-            if 0 in layers and 1 in layers and 2 in layers:
+            if all(layers):
                 # 完全な3層構造がある場合
                 layer0 = layers[0]  # フェードイン (下→中央)
                 layer1 = layers[1]  # 静止表示 (中央)
@@ -98,12 +95,12 @@ class RailwayScrollPluginConverter(PluginConverterBase):
                 
                 timing = RailwayScrollTiming(
                     text=text_content,
-                    fade_in_start_ms=layer0['start_ms'],
-                    fade_in_end_ms=layer0['end_ms'],
-                    static_start_ms=layer1['start_ms'],
-                    static_end_ms=layer1['end_ms'],
-                    fade_out_start_ms=layer2['start_ms'],
-                    fade_out_end_ms=layer2['end_ms'],
+                    fade_in_start_ms=layer0[0],
+                    fade_in_end_ms=layer0[1],
+                    static_start_ms=layer1[0],
+                    static_end_ms=layer1[1],
+                    fade_out_start_ms=layer2[0],
+                    fade_out_end_ms=layer2[1],
                     line_number=line_number
                 )
                 
@@ -111,7 +108,7 @@ class RailwayScrollPluginConverter(PluginConverterBase):
                 line_number += 1
         
         # 開始時間順にソート
-        self.line_timings.sort(key=lambda x: x.fade_in_start_ms)
+        self.line_timings.sort(key=attrgetter('fade_in_start_ms'))
     
     def _get_timing_data_json(self) -> str:
         """タイミングデータのJSON文字列を返す"""
@@ -131,7 +128,7 @@ class RailwayScrollPluginConverter(PluginConverterBase):
                 'total_duration': timing.fade_out_end_ms - timing.fade_in_start_ms
             })
         
-        return json.dumps(timing_data)
+        return JSONUtils.dumps(timing_data)
     
     def _build_template_html(self) -> str:
         """テンプレート固有HTML（Template-Based Generation）"""
@@ -142,11 +139,10 @@ class RailwayScrollPluginConverter(PluginConverterBase):
         template_content = self._load_template_file(template_path)
         
         # Generate lines HTML with common selectors
-        lines_html = []
-        for i, timing in enumerate(self.line_timings):
-            lines_html.append(
-                f'<div class="text-line" data-line="{i}">{timing.text}</div>'
-            )
+        lines_html = [
+            f'<div class="text-line" data-line="{i}">{escape_text(timing.text)}</div>'
+            for i, timing in enumerate(self.line_timings)
+        ]
         
         lines_content = '\n        '.join(lines_html)
         
@@ -154,18 +150,15 @@ class RailwayScrollPluginConverter(PluginConverterBase):
         return template_content.replace('{{LINES_HTML}}', lines_content)
     
     def _load_template_file(self, template_path: str) -> str:
-        """Load template file content"""
-        import os
+        """Load template file content (cached by path and mtime)"""
         try:
-            with open(template_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            return _load_text_file_cached(template_path, os.path.getmtime(template_path))
         except FileNotFoundError:
             # Fallback to legacy generation if template not found
-            lines_html = []
-            for i, timing in enumerate(self.line_timings):
-                lines_html.append(
-                    f'<div class="text-line" data-line="{i}">{timing.text}</div>'
-                )
+            lines_html = [
+                f'<div class="text-line" data-line="{i}">{escape_text(timing.text)}</div>'
+                for i, timing in enumerate(self.line_timings)
+            ]
             content_html = '\n        '.join(lines_html)
             return f"""    <div class="text-container" data-template="railway">
         {content_html}
@@ -173,7 +166,6 @@ class RailwayScrollPluginConverter(PluginConverterBase):
     
     def _build_ui_elements_html(self) -> str:
         """UI要素HTML"""
-        from .utils import HTMLTemplateBuilder
         return HTMLTemplateBuilder.build_ui_elements_html("行", "鉄道方向幕風スクロール")
     
     def _get_template_title(self) -> str:
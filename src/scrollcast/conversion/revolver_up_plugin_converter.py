@@ -9,11 +9,20 @@ Revolver Up Plugin Converter
 - カレント行が次の行に移動
 """
 
-import json
 from typing import List, Dict, Any
 from .plugin_converter_base import PluginConverterBase
 from .plugin_system import TemplateConfig
-from .utils import ASSDialogueParser, ASSTimeUtils
+from .utils import ASSDialogueParser, ASSTimeUtils, JSONUtils, escape_text
+
+
+# 1文字あたりの表示時間（秒）
+CHAR_DISPLAY_SECONDS = 0.3
+
+# 最低表示時間（ミリ秒）
+MIN_DISPLAY_DURATION_MS = 2000
+
+# スライドアニメーション時間（ミリ秒）
+SLIDE_DURATION_MS = 800
 
 
 class RevolverUpPluginConverter(PluginConverterBase):
@@ -26,53 +35,42 @@ class RevolverUpPluginConverter(PluginConverterBase):
     - Unified CSS class structure
     """
     
+    __slots__ = ('line_timings',)
+    
     def __init__(self):
         super().__init__()
         self.line_timings: List[Dict[str, Any]] = []
         
     def parse_ass_file(self, ass_file_path: str) -> None:
         """ASSファイルを解析してタイミングデータを抽出"""
-        with open(ass_file_path, 'r', encoding='utf-8') as f:
-            ass_content = f.read()
+        ass_content = self.read_ass_file_content(ass_file_path)
         
         parser = ASSDialogueParser()
         dialogues = parser.parse_dialogues(ass_content)
         
         self.line_timings = []
         
-        for i, dialogue in enumerate(dialogues):
-            # dialogue is a tuple: (layer, start_time, end_time, text_with_tags)
-            layer, start_time_str, end_time_str, text_with_tags = dialogue
-            
-            # ASSタグを除去
-            clean_text = self.remove_ass_tags(text_with_tags)
-            
-            # 時間をミリ秒に変換
-            start_ms = ASSTimeUtils.to_milliseconds(start_time_str)
-            end_ms = ASSTimeUtils.to_milliseconds(end_time_str)
-            
-            # 文字数に基づく表示時間計算 (0.3秒/文字)
-            char_count = len(clean_text.strip())
-            display_duration = max(char_count * 0.3 * 1000, 2000)  # 最低2秒
-            slide_duration = 800  # スライドアニメーション時間
+        # ASSタグを一括除去（remove_ass_tags_bulk は strip 済みの文字列を返す）
+        clean_texts = self.remove_ass_tags_bulk([dialogue[3] for dialogue in dialogues])
+        # 開始時間を一括でミリ秒に変換（終了時間は表示時間から算出するため不要）
+        start_times = ASSTimeUtils.to_milliseconds_batch([dialogue[1] for dialogue in dialogues])
+        
+        append = self.line_timings.append
+        for i, (clean_text, start_ms) in enumerate(zip(clean_texts, start_times)):
+            # 文字数に基づく表示時間計算 (0.3秒/文字、最低2秒)
+            char_count = len(clean_text)
+            display_duration = max(char_count * CHAR_DISPLAY_SECONDS * 1000, MIN_DISPLAY_DURATION_MS)
             
-            line_data = {
+            append({
                 "line_index": i,
-                "text": clean_text.strip(),
+                "text": clean_text,
                 "char_count": char_count,
                 "start_time": start_ms,
                 "display_duration": display_duration,
-                "slide_duration": slide_duration,
-                "total_duration": display_duration + slide_duration,
-                "end_time": start_ms + display_duration + slide_duration
-            }
-            
-            self.line_timings.append(line_data)
-    
-    def remove_ass_tags(self, text_with_tags: str) -> str:
-        """ASSタグを除去"""
-        import re
-        return re.sub(r'\{[^}]*\}', '', text_with_tags).strip()
+                "slide_duration": SLIDE_DURATION_MS,
+                "total_duration": display_duration + SLIDE_DURATION_MS,
+                "end_time": start_ms + display_duration + SLIDE_DURATION_MS
+            })
     
     def get_template_config(self) -> TemplateConfig:
         """テンプレート設定を返す"""
@@ -108,23 +106,16 @@ class RevolverUpPluginConverter(PluginConverterBase):
     
     def _build_content_html(self) -> str:
         """統一CSS クラス構造でコンテンツHTMLを生成"""
-        content_parts = []
-        
-        for line_data in self.line_timings:
-            line_html = (
-                f'<div class="text-line" data-line="{line_data["line_index"]}">'
-                f'{line_data["text"]}</div>'
-            )
-            content_parts.append(line_html)
-        
-        return '\n            '.join(content_parts)
+        return '\n            '.join([
+            f'<div class="text-line" data-line="{line_data["line_index"]}">'
+            f'{escape_text(line_data["text"])}</div>'
+            for line_data in self.line_timings
+        ])
     
     def _get_timing_data_json(self) -> str:
         """AutoPlayプラグイン用タイミングデータJSONを生成"""
-        timing_entries = []
-        
-        for line_data in self.line_timings:
-            timing_entries.append({
+        timing_entries = [
+            {
                 "sequence_index": line_data["line_index"],
                 "text": line_data["text"],
                 "char_count": line_data["char_count"],
@@ -133,9 +124,11 @@ class RevolverUpPluginConverter(PluginConverterBase):
                 "slide_duration": line_data["slide_duration"],
                 "total_duration": line_data["total_duration"],
                 "end_time": line_data["end_time"]
-            })
+            }
+            for line_data in self.line_timings
+        ]
         
-        return json.dumps(timing_entries, ensure_ascii=False, indent=4)
+        return JSONUtils.dumps(timing_entries)
     
     def _get_title(self) -> str:
         """ページタイトルを生成"""
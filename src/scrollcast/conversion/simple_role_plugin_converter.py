@@ -3,11 +3,12 @@ SimpleRole Plugin-based ASS to HTML converter
 プラグイン型SimpleRoleテンプレート実装（標準フロー準拠）
 """
 
-import json
-from typing import List, Tuple, NamedTuple
-from .utils import ASSTimeUtils, ASSMetadataExtractor, ASSDialogueParser
+import os
+from operator import attrgetter
+from typing import Iterable, List, Tuple, NamedTuple
+from .utils import ASSTimeUtils, ASSMetadataExtractor, ASSDialogueStream, HTMLTemplateBuilder, JSONUtils, escape_text
 from .plugin_system import TemplateConfig
-from .plugin_converter_base import PluginConverterBase
+from .plugin_converter_base import PluginConverterBase, _load_text_file_cached
 
 
 class SimpleRoleTiming(NamedTuple):
@@ -21,6 +22,8 @@ class SimpleRoleTiming(NamedTuple):
 class SimpleRolePluginConverter(PluginConverterBase):
     """プラグイン型SimpleRole ASS→HTML変換クラス"""
     
+    __slots__ = ('line_timings',)
+    
     def __init__(self):
         super().__init__()
         self.line_timings: List[SimpleRoleTiming] = []
@@ -52,22 +55,20 @@ class SimpleRolePluginConverter(PluginConverterBase):
         # メタデータ抽出
         self.metadata = ASSMetadataExtractor.extract_metadata(content, "Simple_Role")
         
-        # Dialogue行の抽出と総時間計算
-        dialogue_matches = ASSDialogueParser.parse_dialogues(content)
-        self.total_duration_ms = ASSDialogueParser.calculate_total_duration(dialogue_matches)
+        # Dialogue行の解析と総時間計算
+        dialogue_stream = ASSDialogueStream(content)
+        self._parse_simple_role_timings(dialogue_stream)
+        self.total_duration_ms = dialogue_stream.total_duration_ms
         self.metadata.total_duration_ms = self.total_duration_ms
-        
-        # SimpleRole固有のタイミング解析
-        self._parse_simple_role_timings(dialogue_matches)
     
-    def _parse_simple_role_timings(self, dialogue_matches: List[Tuple[str, str, str, str]]) -> None:
+    def _parse_simple_role_timings(self, dialogue_matches: Iterable[Tuple[str, str, str, str]]) -> None:
         """SimpleRole固有のタイミング解析"""
         self.line_timings = []
         line_number = 0
         
         for layer, start_time, end_time, text_with_tags in dialogue_matches:
-            # Layer 0のみ処理
-            if int(layer) == 0:
+            # Layer 0のみ処理（int変換せず数字列のまま判定、ゼロ埋め表記も0として扱う）
+            if not layer.lstrip('0'):
                 # テキスト内容を抽出（ASSタグを除去）
                 text_content = self.remove_ass_tags(text_with_tags)
                 
@@ -88,21 +89,21 @@ class SimpleRolePluginConverter(PluginConverterBase):
                 line_number += 1
         
         # 開始時間順にソート
-        self.line_timings.sort(key=lambda x: x.start_ms)
+        self.line_timings.sort(key=attrgetter('start_ms'))
     
     def _get_timing_data_json(self) -> str:
         """タイミングデータのJSON文字列を返す"""
-        timing_data = []
-        
-        for timing in self.line_timings:
-            timing_data.append({
+        timing_data = [
+            {
                 'text': timing.text,
                 'start_time': timing.start_ms,
                 'duration': timing.end_ms - timing.start_ms,
                 'line_index': timing.line_number
-            })
+            }
+            for timing in self.line_timings
+        ]
         
-        return json.dumps(timing_data)
+        return JSONUtils.dumps(timing_data)
     
     def _build_template_html(self) -> str:
         """テンプレート固有HTML（Template-Based Generation）"""
@@ -113,11 +114,10 @@ class SimpleRolePluginConverter(PluginConverterBase):
         template_content = self._load_template_file(template_path)
         
         # Generate lines HTML with common selectors
-        lines_html = []
-        for timing in self.line_timings:
-            lines_html.append(
-                f'<div class="text-line" data-line="{timing.line_number}">{timing.text}</div>'
-            )
+        lines_html = [
+            f'<div class="text-line" data-line="{timing.line_number}">{escape_text(timing.text)}</div>'
+            for timing in self.line_timings
+        ]
         
         lines_content = '\n        '.join(lines_html)
         
@@ -125,18 +125,15 @@ class SimpleRolePluginConverter(PluginConverterBase):
         return template_content.replace('{{LINES_HTML}}', lines_content)
     
     def _load_template_file(self, template_path: str) -> str:
-        """Load template file content"""
-        import os
+        """Load template file content (cached by path and mtime)"""
         try:
-            with open(template_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            return _load_text_file_cached(template_path, os.path.getmtime(template_path))
         except FileNotFoundError:
             # Fallback to legacy generation if template not found
-            lines_html = []
-            for timing in self.line_timings:
-                lines_html.append(
-                    f'<div class="text-line" data-line="{timing.line_number}">{timing.text}</div>'
-                )
+            lines_html = [
+                f'<div class="text-line" data-line="{timing.line_number}">{escape_text(timing.text)}</div>'
+                for timing in self.line_timings
+            ]
             content_html = '\n        '.join(lines_html)
             return f"""    <div class="text-container" data-template="scroll">
         {content_html}
@@ -144,7 +141,6 @@ class SimpleRolePluginConverter(PluginConverterBase):
     
     def _build_ui_elements_html(self) -> str:
         """UI要素HTML"""
-        from .utils import HTMLTemplateBuilder
         return HTMLTemplateBuilder.build_ui_elements_html("行", "シンプルロール（エンドロール風）")
     
     def _get_template_title(self) -> str:
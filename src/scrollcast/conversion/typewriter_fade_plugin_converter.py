@@ -4,20 +4,23 @@ TypewriterFade Plugin-based ASS to HTML converter
 """
 
 import re
-import json
-from typing import List, Tuple, NamedTuple
-from .utils import ASSTimeUtils, ASSMetadataExtractor, ASSDialogueParser
+from operator import attrgetter
+from typing import Any, Dict, List, Tuple, NamedTuple
+from .utils import ASSTimeUtils, ASSMetadataExtractor, ASSDialogueParser, HTMLTemplateBuilder, JSONUtils, escape_text
 from .plugin_system import TemplateConfig
 from .plugin_converter_base import PluginConverterBase
 
 
+# パターン: {\k15\alpha&HFF&\t(150,250,\alpha&H00&)}e
+TYPEWRITER_CHAR_PATTERN = re.compile(r'\{[^}]*\\t\((\d+),(\d+),[^)]*\)\}(.)')
+
+
 class CharacterTiming(NamedTuple):
     """文字とそのタイミング情報"""
     char: str
     fade_start_ms: int
     fade_end_ms: int
     scroll_position: float  # 0.0 - 1.0
-    y_position: int  # Y座標位置
     line_number: int  # 行番号
     dialogue_start_ms: int  # Dialogue開始時間
     dialogue_end_ms: int    # Dialogue終了時間
@@ -26,9 +29,13 @@ class CharacterTiming(NamedTuple):
 class TypewriterFadePluginConverter(PluginConverterBase):
     """プラグイン型TypewriterFade ASS→HTML変換クラス"""
     
+    __slots__ = ('character_timings', 'sentence_timings')
+    
     def __init__(self):
         super().__init__()
         self.character_timings: List[CharacterTiming] = []
+        # 文（Dialogue行）ごとの文字タイミング（文・文字とも開始時間順）
+        self.sentence_timings: List[List[CharacterTiming]] = []
     
     def get_template_config(self) -> TemplateConfig:
         """TypewriterFadeテンプレートのプラグイン設定（シンプルテキストフロー版）"""
@@ -66,25 +73,28 @@ class TypewriterFadePluginConverter(PluginConverterBase):
     def _parse_typewriter_timings(self, dialogue_matches: List[Tuple[str, str, str, str]]) -> None:
         """TypewriterFade固有のタイミング解析"""
         self.character_timings = []
+        self.sentence_timings = []
         dialogue_line_index = 0
         
         for layer, start_time, end_time, text_with_tags in dialogue_matches:
-            # レイヤー0のみ処理（レイヤー1は空行用のため）
-            if int(layer) == 0:
+            # レイヤー0のみ処理（レイヤー1は空行用のため。数字列のまま判定）
+            if not layer.lstrip('0'):
                 line_timings = self._parse_character_timings_with_position(
                     text_with_tags, start_time, end_time, dialogue_line_index
                 )
                 self.character_timings.extend(line_timings)
+                if line_timings:
+                    line_timings.sort(key=attrgetter('fade_start_ms'))
+                    self.sentence_timings.append(line_timings)
                 dialogue_line_index += 1
+        
+        # 行単位のグループ化とソートを解析時に1度だけ行い、JSON/HTML生成で共有
+        self.sentence_timings.sort(key=lambda chars: chars[0].fade_start_ms)
     
     def _parse_character_timings_with_position(self, text_with_tags: str, 
                                              start_time: str, end_time: str, 
                                              dialogue_line_index: int = 0) -> List[CharacterTiming]:
         """ASSタグ付きテキストから文字とタイミング・位置情報を抽出"""
-        # Y位置を抽出
-        pos_match = re.search(r'\\pos\((\d+),(\d+)\)', text_with_tags)
-        y_position = int(pos_match.group(2)) if pos_match else 960
-        
         # 行番号はDialogue行のシーケンス番号を使用
         line_number = dialogue_line_index
         
@@ -92,50 +102,43 @@ class TypewriterFadePluginConverter(PluginConverterBase):
         start_time_ms = ASSTimeUtils.to_milliseconds(start_time)
         end_time_ms = ASSTimeUtils.to_milliseconds(end_time)
         
-        # パターン: {\k15\alpha&HFF&\t(150,250,\alpha&H00&)}e
-        pattern = r'\{[^}]*\\t\((\d+),(\d+),[^)]*\)\}(.)'
-        matches = re.findall(pattern, text_with_tags)
+        matches = TYPEWRITER_CHAR_PATTERN.findall(text_with_tags)
         
-        character_timings = []
-        for fade_start, fade_end, char in matches:
-            fade_start_ms = start_time_ms + int(fade_start)
-            fade_end_ms = start_time_ms + int(fade_end)
-            
-            # スクロール位置を計算
-            scroll_position = fade_end_ms / self.metadata.total_duration_ms if self.metadata.total_duration_ms > 0 else 0
-            
-            character_timings.append(CharacterTiming(
-                char=char,
-                fade_start_ms=fade_start_ms,
-                fade_end_ms=fade_end_ms,
-                scroll_position=scroll_position,
-                y_position=y_position,
-                line_number=line_number,
-                dialogue_start_ms=start_time_ms,
-                dialogue_end_ms=end_time_ms
-            ))
-        
-        return character_timings
+        # ループ内で不変な値は事前に取り出し、位置引数でタプルを生成
+        total_duration_ms = self.metadata.total_duration_ms
+        if total_duration_ms <= 0:
+            # 総時間が不明な場合はスクロール位置を0に固定
+            return [
+                CharacterTiming(
+                    char, start_time_ms + int(fade_start), start_time_ms + int(fade_end), 0,
+                    line_number, start_time_ms, end_time_ms
+                )
+                for fade_start, fade_end, char in matches
+            ]
+        
+        # スクロール位置 = フェード終了時刻 / 総時間（分岐をループ外へ出して1パスで生成）
+        return [
+            CharacterTiming(
+                char, start_time_ms + int(fade_start), fade_end_ms, fade_end_ms / total_duration_ms,
+                line_number, start_time_ms, end_time_ms
+            )
+            for fade_start, fade_end, char in matches
+            for fade_end_ms in (start_time_ms + int(fade_end),)
+        ]
     
     def _get_timing_data_json(self) -> str:
         """タイミングデータのJSON文字列を返す"""
-        # 行番号でグループ化
-        sentences_dict = {}
-        
-        for timing in self.character_timings:
-            line_number = timing.line_number
-            if line_number not in sentences_dict:
-                sentences_dict[line_number] = []
-            sentences_dict[line_number].append(timing)
-        
-        # 開始時間順にソート
-        sorted_sentences = sorted(sentences_dict.items(), key=lambda x: min(t.fade_start_ms for t in x[1]))
-        
-        # タイミングデータを生成
+        return JSONUtils.dumps(self._build_timing_data())
+    
+    def _get_timing_data_bytes(self) -> bytes:
+        """タイミングデータをUTF-8のJSONバイト列で返す（文字単位で大きくなるため直接生成）"""
+        return JSONUtils.dumps_bytes(self._build_timing_data())
+    
+    def _build_timing_data(self) -> List[Dict[str, Any]]:
+        """文ごとのタイミングデータを生成"""
         sentences_timing_data = []
         
-        for sentence_id, (line_number, char_timings) in enumerate(sorted_sentences):
-            sorted_chars = sorted(char_timings, key=lambda x: x.fade_start_ms)
+        for sorted_chars in self.sentence_timings:
             char_timing_data = []
             
             for timing in sorted_chars:
@@ -149,8 +152,8 @@ class TypewriterFadePluginConverter(PluginConverterBase):
                 })
             
             # Dialogue全体のタイミング情報を追加
-            dialogue_start = char_timings[0].dialogue_start_ms
-            dialogue_end = char_timings[0].dialogue_end_ms
+            dialogue_start = sorted_chars[0].dialogue_start_ms
+            dialogue_end = sorted_chars[0].dialogue_end_ms
             sentences_timing_data.append({
                 'start_time': dialogue_start,  # 絶対開始時間（auto-playプラグイン用）
                 'dialogue_start': dialogue_start,
@@ -159,36 +162,18 @@ class TypewriterFadePluginConverter(PluginConverterBase):
                 'chars': char_timing_data
             })
         
-        return json.dumps(sentences_timing_data)
+        return sentences_timing_data
     
     def _build_template_html(self) -> str:
         """テンプレート固有HTML"""
-        # 行番号でグループ化
-        sentences_dict = {}
-        
-        for timing in self.character_timings:
-            line_number = timing.line_number
-            if line_number not in sentences_dict:
-                sentences_dict[line_number] = []
-            sentences_dict[line_number].append(timing)
-        
-        # 開始時間順にソート
-        sorted_sentences = sorted(sentences_dict.items(), key=lambda x: min(t.fade_start_ms for t in x[1]))
-        
-        # 文ごとのHTML要素を生成
+        # 文ごとのHTML要素を生成（文字は data-sentence + data-char-index で参照する）
         sentences_html = []
-        char_id = 0
         
-        for sentence_id, (line_number, char_timings) in enumerate(sorted_sentences):
-            # 文字を開始時間順にソート
-            sorted_chars = sorted(char_timings, key=lambda x: x.fade_start_ms)
-            sentence_chars = []
-            
-            for timing in sorted_chars:
-                sentence_chars.append(
-                    f'<span class="text-char typewriter-char" data-char-index="{len(sentence_chars)}" id="char-{char_id}">{timing.char}</span>'
-                )
-                char_id += 1
+        for sentence_id, sorted_chars in enumerate(self.sentence_timings):
+            sentence_chars = [
+                f'<span class="text-char typewriter-char" data-char-index="{i}">{escape_text(timing.char)}</span>'
+                for i, timing in enumerate(sorted_chars)
+            ]
             
             sentences_html.append(
                 f'<div class="text-sentence typewriter-sentence" data-sentence="{sentence_id}">{"".join(sentence_chars)}</div>'
@@ -201,7 +186,6 @@ class TypewriterFadePluginConverter(PluginConverterBase):
     
     def _build_ui_elements_html(self) -> str:
         """UI要素HTML"""
-        from .utils import HTMLTemplateBuilder
         return HTMLTemplateBuilder.build_ui_elements_html("文", "タイプライター風フェード")
     
     def _get_template_title(self) -> str:
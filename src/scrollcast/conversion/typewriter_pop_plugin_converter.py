@@ -4,9 +4,8 @@ TypewriterPop Plugin-based ASS to HTML converter
 """
 
 import re
-import json
-from typing import List, Tuple, NamedTuple
-from .utils import ASSTimeUtils, ASSMetadataExtractor, ASSDialogueParser
+from typing import Iterable, List, Tuple, NamedTuple
+from .utils import ASSTimeUtils, ASSMetadataExtractor, ASSDialogueStream, JSONUtils, escape_text
 from .plugin_system import TemplateConfig
 from .plugin_converter_base import PluginConverterBase
 
@@ -18,11 +17,14 @@ class TypewriterPopTiming(NamedTuple):
     end_time_ms: int
     duration_ms: int
     line_index: int
+    escaped_text: str = ''  # HTML埋め込み用にエスケープ済みのテキスト（解析時に1度だけ生成）
 
 
 class TypewriterPopPluginConverter(PluginConverterBase):
     """プラグイン型TypewriterPop ASS→HTML変換クラス"""
     
+    __slots__ = ('timings',)
+    
     def __init__(self):
         super().__init__()
         self.timings: List[TypewriterPopTiming] = []
@@ -51,62 +53,56 @@ class TypewriterPopPluginConverter(PluginConverterBase):
         # メタデータ抽出
         self.metadata = ASSMetadataExtractor.extract_metadata(content, "TypewriterPop")
         
-        # Dialogue行の抽出と総時間計算
-        dialogue_matches = ASSDialogueParser.parse_dialogues(content)
-        self.total_duration_ms = ASSDialogueParser.calculate_total_duration(dialogue_matches)
+        # Dialogue行の解析と総時間計算
+        dialogue_stream = ASSDialogueStream(content)
+        self._parse_timings(dialogue_stream)
+        self.total_duration_ms = dialogue_stream.total_duration_ms
         self.metadata.total_duration_ms = self.total_duration_ms
-        
-        # タイミング解析
-        self._parse_timings(dialogue_matches)
     
-    def _parse_timings(self, dialogue_matches: List[Tuple[str, str, str, str]]) -> None:
+    def _parse_timings(self, dialogue_matches: Iterable[Tuple[str, str, str, str]]) -> None:
         """タイミング解析"""
         self.timings = []
         
+        to_milliseconds = ASSTimeUtils.to_milliseconds
+        remove_ass_tags = self.remove_ass_tags
+        append = self.timings.append
+        
         for line_index, (layer, start_time, end_time, text_with_tags) in enumerate(dialogue_matches):
-            if int(layer) == 0:  # メイン行のみ処理
+            if not layer.lstrip('0'):  # メイン行のみ処理
                 # ASSタグを除去してクリーンなテキストを取得
-                clean_text = self.remove_ass_tags(text_with_tags)
+                clean_text = remove_ass_tags(text_with_tags)
                 
                 # 時間をミリ秒に変換
-                start_time_ms = ASSTimeUtils.to_milliseconds(start_time)
-                end_time_ms = ASSTimeUtils.to_milliseconds(end_time)
-                duration_ms = end_time_ms - start_time_ms
+                start_time_ms = to_milliseconds(start_time)
+                end_time_ms = to_milliseconds(end_time)
                 
-                timing = TypewriterPopTiming(
-                    text=clean_text,
-                    start_time_ms=start_time_ms,
-                    end_time_ms=end_time_ms,
-                    duration_ms=duration_ms,
-                    line_index=line_index
-                )
-                self.timings.append(timing)
+                # (text, start, end, duration, line_index, escaped_text) を位置引数で生成
+                append(TypewriterPopTiming(
+                    clean_text, start_time_ms, end_time_ms,
+                    end_time_ms - start_time_ms, line_index, escape_text(clean_text)
+                ))
     
     def _get_timing_data_json(self) -> str:
         """タイミングデータのJSON文字列を返す"""
-        timing_data = []
-        for timing in self.timings:
-            timing_data.append({
+        timing_data = [
+            {
                 "text": timing.text,
                 "start_time": timing.start_time_ms,
                 "duration": timing.duration_ms,
                 "line_index": timing.line_index
-            })
+            }
+            for timing in self.timings
+        ]
         
-        return json.dumps(timing_data, ensure_ascii=False, indent=2)
+        return JSONUtils.dumps(timing_data)
     
     def _build_template_html(self) -> str:
         """テンプレート固有HTML"""
-        html_parts = []
-        html_parts.append(f'<div class="text-container" data-template="typewriter">')
-        
-        for timing in self.timings:
-            html_parts.append(
-                f'    <div class="text-line" data-line="{timing.line_index}">{timing.text}</div>'
-            )
-        
-        html_parts.append('</div>')
-        return '\n'.join(html_parts)
+        lines_html = '\n'.join([
+            f'    <div class="text-line" data-line="{timing.line_index}">{timing.escaped_text or escape_text(timing.text)}</div>'
+            for timing in self.timings
+        ])
+        return f'<div class="text-container" data-template="typewriter">\n{lines_html}\n</div>'
     
     def _build_ui_elements_html(self) -> str:
         """UI要素HTML"""
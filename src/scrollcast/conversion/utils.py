@@ -4,10 +4,45 @@ ASS to HTML conversion utilities
 """
 
 import re
-from typing import List, Tuple, NamedTuple
+import json
+from html import escape
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, List, Tuple, NamedTuple
 from dataclasses import dataclass
 from pathlib import Path
 
+# Optional dependency for fast JSON serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# ASS時間文字列→ミリ秒変換のキャッシュ上限（字幕の開始/終了時刻は重複が多い）
+TIME_CACHE_MAX_SIZE = 4096
+
+# [Script Info] の解像度指定パターン
+PLAY_RES_X_PATTERN = re.compile(r'PlayResX:\s*(\d+)')
+PLAY_RES_Y_PATTERN = re.compile(r'PlayResY:\s*(\d+)')
+
+# Style行のパターン: (style_name, font_family, font_size)
+STYLE_PATTERN = re.compile(r'Style:\s*([^,]+),([^,]+),(\d+),')
+
+# Dialogue行のパターン: (layer, start, end, text_with_tags)
+DIALOGUE_PATTERN = re.compile(r'Dialogue:\s*(\d+),([^,]+),([^,]+),[^,]*,[^,]*,[^,]*,[^,]*,[^,]*,[^,]*,(.+)')
+
+
+@lru_cache(maxsize=64)
+def _responsive_font_size(font_size: int, play_res_x: int) -> float:
+    """フォントサイズと横解像度からvw単位のフォントサイズを計算（組み合わせ単位でキャッシュ）"""
+    return round(font_size * 100 / play_res_x, 2)
+
+
+def escape_text(text: str) -> str:
+    """テキストノード用にHTMLエスケープ（&, <, > のみ。引用符は変換しない）"""
+    return escape(text, quote=False)
+
 
 @dataclass
 class ASSMetadata:
@@ -21,13 +56,15 @@ class ASSMetadata:
     @property
     def responsive_font_size(self) -> float:
         """レスポンシブフォントサイズ（vw単位）を計算"""
-        return round(self.font_size * 100 / self.play_res_x, 2)
+        # フィールドは変更可能なため、インスタンスではなく入力値の組でキャッシュする
+        return _responsive_font_size(self.font_size, self.play_res_x)
 
 
 class ASSTimeUtils:
     """ASS時間形式のユーティリティ"""
     
     @staticmethod
+    @lru_cache(maxsize=TIME_CACHE_MAX_SIZE)
     def to_milliseconds(time_str: str) -> int:
         """ASS時間形式をミリ秒に変換
         
@@ -37,15 +74,75 @@ class ASSTimeUtils:
         Returns:
             ミリ秒
         """
-        time_parts = time_str.split(':')
-        hours = int(time_parts[0])
-        minutes = int(time_parts[1])
-        seconds_parts = time_parts[2].split('.')
-        seconds = int(seconds_parts[0])
-        centiseconds = int(seconds_parts[1]) if len(seconds_parts) > 1 else 0
+        # H:MM:SS.cc を1回の split と partition で分解（中間リストを1つに抑える）
+        hours, minutes, rest = time_str.split(':', 2)
+        seconds, _, centiseconds = rest.partition('.')
         
-        total_ms = (hours * 3600 + minutes * 60 + seconds) * 1000 + centiseconds * 10
+        total_ms = (int(hours) * 3600 + int(minutes) * 60 + int(seconds)) * 1000
+        if centiseconds:
+            total_ms += int(centiseconds) * 10
         return total_ms
+    
+    @staticmethod
+    def to_milliseconds_batch(time_strs: Iterable[str]) -> List[int]:
+        """複数のASS時間形式をまとめてミリ秒に変換
+        
+        Args:
+            time_strs: ASS時間形式の並び
+            
+        Returns:
+            ミリ秒のリスト（入力順）
+        """
+        return list(map(ASSTimeUtils.to_milliseconds, time_strs))
+
+
+class JSONUtils:
+    """JSONシリアライズのユーティリティ（orjson優先、標準jsonフォールバック）"""
+    
+    @staticmethod
+    def dumps(data: Any, pretty: bool = False, sort_keys: bool = False) -> str:
+        """データをJSON文字列に変換
+        
+        Args:
+            data: シリアライズ対象のデータ
+            pretty: 2スペースインデントで整形するか
+            sort_keys: 辞書のキーをソートするか（キャッシュキー等の安定化用）
+            
+        Returns:
+            JSON文字列（非ASCII文字はエスケープしない）
+        """
+        if ORJSON_AVAILABLE:
+            option = orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            if sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            return orjson.dumps(data, option=option).decode('utf-8')
+        
+        if pretty:
+            return json.dumps(data, ensure_ascii=False, indent=2, sort_keys=sort_keys)
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':'), sort_keys=sort_keys)
+    
+    @staticmethod
+    def dumps_bytes(data: Any, pretty: bool = False) -> bytes:
+        """データをUTF-8エンコード済みのJSONバイト列に変換
+        
+        orjson利用時はエンコーダの出力をそのまま返し、str経由のデコード/再エンコードを省く。
+        
+        Args:
+            data: シリアライズ対象のデータ
+            pretty: 2スペースインデントで整形するか
+            
+        Returns:
+            UTF-8のJSONバイト列
+        """
+        if ORJSON_AVAILABLE:
+            option = orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(data, option=option)
+        
+        return JSONUtils.dumps(data, pretty).encode('utf-8')
 
 
 class ASSMetadataExtractor:
@@ -61,8 +158,8 @@ class ASSMetadataExtractor:
         Returns:
             (width, height) のタプル
         """
-        res_x_match = re.search(r'PlayResX:\s*(\d+)', content)
-        res_y_match = re.search(r'PlayResY:\s*(\d+)', content)
+        res_x_match = PLAY_RES_X_PATTERN.search(content)
+        res_y_match = PLAY_RES_Y_PATTERN.search(content)
         
         play_res_x = int(res_x_match.group(1)) if res_x_match else 1080
         play_res_y = int(res_y_match.group(1)) if res_y_match else 1920
@@ -80,10 +177,9 @@ class ASSMetadataExtractor:
         Returns:
             (font_family, font_size) のタプル
         """
-        style_pattern = r'Style:\s*([^,]+),([^,]+),(\d+),'
-        style_matches = re.findall(style_pattern, content)
-        
-        for style_name, font_family, font_size in style_matches:
+        # 最初に一致したスタイルで打ち切るため、全件を展開せずに走査
+        for style_match in STYLE_PATTERN.finditer(content):
+            style_name, font_family, font_size = style_match.groups()
             if target_style_name in style_name:
                 return font_family, int(font_size)
         
@@ -128,8 +224,7 @@ class ASSDialogueParser:
         Raises:
             ValueError: Dialogue行が見つからない場合
         """
-        dialogue_pattern = r'Dialogue:\s*(\d+),([^,]+),([^,]+),[^,]*,[^,]*,[^,]*,[^,]*,[^,]*,[^,]*,(.+)'
-        dialogue_matches = re.findall(dialogue_pattern, content)
+        dialogue_matches = DIALOGUE_PATTERN.findall(content)
         
         if not dialogue_matches:
             raise ValueError("Dialogue行が見つかりません")
@@ -146,12 +241,41 @@ class ASSDialogueParser:
         Returns:
             総再生時間（ミリ秒）
         """
+        end_times = ASSTimeUtils.to_milliseconds_batch(match[2] for match in dialogue_matches)
+        return max(end_times, default=0)
+
+
+class ASSDialogueStream:
+    """Dialogue行を1パスで走査しながら総再生時間を集計するイテラブル
+    
+    走査完了後に total_duration_ms が確定する。
+    """
+    
+    __slots__ = ('content', 'total_duration_ms')
+    
+    def __init__(self, content: str):
+        self.content = content
+        self.total_duration_ms = 0
+    
+    def __iter__(self) -> Iterator[Tuple[str, str, str, str]]:
+        """(layer, start_time, end_time, text_with_tags) を順に返す
+        
+        Raises:
+            ValueError: Dialogue行が見つからない場合
+        """
         max_end_time = 0
-        for layer, start_time, end_time, text_with_tags in dialogue_matches:
-            end_ms = ASSTimeUtils.to_milliseconds(end_time)
-            max_end_time = max(max_end_time, end_ms)
+        found = False
+        for match in DIALOGUE_PATTERN.finditer(self.content):
+            found = True
+            dialogue = match.groups()
+            end_ms = ASSTimeUtils.to_milliseconds(dialogue[2])
+            if end_ms > max_end_time:
+                max_end_time = end_ms
+            yield dialogue
         
-        return max_end_time
+        if not found:
+            raise ValueError("Dialogue行が見つかりません")
+        self.total_duration_ms = max_end_time
 
 
 class HTMLTemplateBuilder:
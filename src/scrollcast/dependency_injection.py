@@ -3,10 +3,13 @@ Dependency Injection Container
 依存性注入コンテナの実装
 """
 
-from typing import Dict, Type, TypeVar, Optional, Any, Callable, List
+from typing import Dict, Type, TypeVar, Optional, Any, Callable, List, Mapping, Tuple
 import threading
 import time
 from abc import ABC, abstractmethod
+from functools import lru_cache, partial
+from importlib import import_module
+from types import MappingProxyType
 
 from .interfaces import (
     ServiceContainerProtocol,
@@ -24,15 +27,46 @@ from .monitoring import get_monitor, get_quality_monitor, MetricType
 
 T = TypeVar('T')
 
+# 辞書参照で未登録を判別するための番兵（None を登録値として扱えるようにする）
+_MISSING = object()
+
+
+def _freeze_settings(value: Any) -> Any:
+    """設定辞書を入れ子ごと読み取り専用ビューに変換"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze_settings(item) for key, item in value.items()})
+    return value
+
+
+@lru_cache(maxsize=512)
+def _metric_tags(service_name: str, key: str, value: str) -> Dict[str, str]:
+    """サービス解決メトリクスのタグ辞書を取得（組み合わせ単位でキャッシュし、呼び出し毎の生成を省く）
+    
+    返される辞書は共有されるため、呼び出し側で変更しないこと。
+    """
+    return {'service_type': service_name, key: value}
+
+
+# 重いサブモジュールは初回利用時にのみ読み込み、以降はクラスをキャッシュから返す
+@lru_cache(maxsize=None)
+def _lazy_import(module: str, attr: str) -> Any:
+    """パッケージ相対のモジュールから属性を遅延インポート"""
+    return getattr(import_module(module, __package__), attr)
+
 
 class ServiceContainer:
     """依存性注入サービスコンテナ"""
     
-    def __init__(self):
+    def __init__(self, metrics_enabled: bool = True):
         self._services: Dict[Type, Any] = {}
         self._singletons: Dict[Type, Any] = {}
         self._factories: Dict[Type, Callable[[], Any]] = {}
         self._lock = threading.RLock()
+        
+        # サービス解決時間のメトリクス記録（既定で有効。False で解決処理を辞書参照のみにする）
+        self._metrics_enabled = metrics_enabled
+        # 監視インスタンスは初回のメトリクス記録時に取得（無効時は監視スレッドを起動しない）
+        self._monitor = None
     
     def register_singleton(self, service_type: Type[T], instance: T) -> None:
         """シングルトンサービスを登録
@@ -76,57 +110,72 @@ class ServiceContainer:
         Raises:
             ValueError: サービスが登録されていない場合
         """
-        with self._lock:
-            # メトリクス記録
-            monitor = get_monitor()
-            start_time = time.time()
-            
-            try:
-                # シングルトンチェック
-                if service_type in self._singletons:
-                    result = self._singletons[service_type]
-                    resolve_time = time.time() - start_time
-                    monitor.record_metric(
-                        'service_resolve_time', resolve_time * 1000, MetricType.PERFORMANCE,
-                        {'service_type': service_type.__name__, 'resolve_type': 'singleton'}
-                    )
-                    return result
-                
-                # ファクトリーチェック
-                if service_type in self._factories:
-                    result = self._factories[service_type]()
-                    resolve_time = time.time() - start_time
-                    monitor.record_metric(
-                        'service_resolve_time', resolve_time * 1000, MetricType.PERFORMANCE,
-                        {'service_type': service_type.__name__, 'resolve_type': 'factory'}
-                    )
-                    return result
-                
-                # 実装チェック
-                if service_type in self._services:
-                    implementation_type = self._services[service_type]
-                    result = implementation_type()
-                    resolve_time = time.time() - start_time
-                    monitor.record_metric(
-                        'service_resolve_time', resolve_time * 1000, MetricType.PERFORMANCE,
-                        {'service_type': service_type.__name__, 'resolve_type': 'implementation'}
-                    )
-                    return result
-                
-                # サービス未登録エラー
-                monitor.record_metric(
-                    'service_resolve_error', 1.0, MetricType.SYSTEM,
-                    {'service_type': service_type.__name__, 'error': 'not_registered'}
-                )
+        # 解決は読み取り専用の辞書参照のみのためロックを取らない
+        # （dict.get はGIL下でアトミック。ロックは登録・削除時のみ使用）
+        if not self._metrics_enabled:
+            # メトリクス無効時は辞書の参照のみで解決（時刻取得・監視呼び出しを省略）
+            result, resolve_type = self._resolve(service_type)
+            if resolve_type is None:
                 raise ValueError(f"Service of type {service_type} is not registered")
-                
-            except Exception as e:
-                resolve_time = time.time() - start_time
+            return result
+        
+        return self._get_with_metrics(service_type)
+    
+    def _resolve(self, service_type: Type[T]) -> Tuple[Optional[T], Optional[str]]:
+        """登録種別に応じてサービスを解決
+        
+        Returns:
+            (インスタンス, 解決種別) のタプル。未登録の場合は (None, None)
+        """
+        # シングルトンチェック（参照1回で判定し、clear() との競合でKeyErrorにならないようにする）
+        instance = self._singletons.get(service_type, _MISSING)
+        if instance is not _MISSING:
+            return instance, 'singleton'
+        
+        # ファクトリーチェック
+        factory = self._factories.get(service_type)
+        if factory is not None:
+            return factory(), 'factory'
+        
+        # 実装チェック
+        implementation_type = self._services.get(service_type)
+        if implementation_type is not None:
+            return implementation_type(), 'implementation'
+        
+        return None, None
+    
+    def _get_with_metrics(self, service_type: Type[T]) -> T:
+        """解決時間のメトリクスを記録しながらサービスを取得"""
+        monitor = self._monitor
+        if monitor is None:
+            monitor = self._monitor = get_monitor()
+        start_ns = time.perf_counter_ns()
+        
+        try:
+            result, resolve_type = self._resolve(service_type)
+            
+            if resolve_type is not None:
+                resolve_time_ms = (time.perf_counter_ns() - start_ns) / 1e6
                 monitor.record_metric(
-                    'service_resolve_error', 1.0, MetricType.SYSTEM,
-                    {'service_type': service_type.__name__, 'error': str(e), 'resolve_time': resolve_time * 1000}
+                    'service_resolve_time', resolve_time_ms, MetricType.PERFORMANCE,
+                    _metric_tags(service_type.__name__, 'resolve_type', resolve_type)
                 )
-                raise
+                return result
+            
+            # サービス未登録エラー
+            monitor.record_metric(
+                'service_resolve_error', 1.0, MetricType.SYSTEM,
+                _metric_tags(service_type.__name__, 'error', 'not_registered')
+            )
+            raise ValueError(f"Service of type {service_type} is not registered")
+            
+        except Exception as e:
+            resolve_time_ms = (time.perf_counter_ns() - start_ns) / 1e6
+            monitor.record_metric(
+                'service_resolve_error', 1.0, MetricType.SYSTEM,
+                {'service_type': service_type.__name__, 'error': str(e), 'resolve_time': resolve_time_ms}
+            )
+            raise
     
     def is_registered(self, service_type: Type[T]) -> bool:
         """サービスが登録されているかチェック
@@ -137,10 +186,9 @@ class ServiceContainer:
         Returns:
             登録されている場合True
         """
-        with self._lock:
-            return (service_type in self._singletons or 
-                   service_type in self._factories or 
-                   service_type in self._services)
+        return (service_type in self._singletons or 
+               service_type in self._factories or 
+               service_type in self._services)
     
     def clear(self) -> None:
         """全サービスを削除"""
@@ -158,23 +206,18 @@ class ServiceFactory:
     
     def create_text_formatter(self, config=None) -> TextFormatterProtocol:
         """テキストフォーマッターを作成"""
-        from .boxing.text_formatter import TextFormatter
-        from .boxing.display_config import DisplayConfig
-        
         if config is None:
-            config = DisplayConfig.create_mobile_portrait()
+            config = _lazy_import('.boxing.display_config', 'DisplayConfig').create_mobile_portrait()
         
-        return TextFormatter(config)
+        return _lazy_import('.boxing.text_formatter', 'TextFormatter')(config)
     
     def create_video_generator(self, resolution=(1080, 1920)) -> VideoGeneratorProtocol:
         """動画ジェネレーターを作成"""
-        from .rendering.video_generator import VideoGenerator
-        return VideoGenerator(default_resolution=resolution)
+        return _lazy_import('.rendering.video_generator', 'VideoGenerator')(default_resolution=resolution)
     
     def create_ass_builder(self, title="Subtitle") -> ASSBuilderProtocol:
         """ASSビルダーを作成"""
-        from .packing.ass_builder import ASSBuilder
-        return ASSBuilder(title=title)
+        return _lazy_import('.packing.ass_builder', 'ASSBuilder')(title=title)
     
     def create_template(self, template_type: str) -> Optional[TemplateProtocol]:
         """テンプレートを作成"""
@@ -191,25 +234,22 @@ class ServiceFactory:
     
     def _create_typewriter_fade(self) -> TemplateProtocol:
         """TypewriterFadeテンプレートを作成"""
-        from .coloring.typewriter_fade import TypewriterFadeTemplate
-        return TypewriterFadeTemplate()
+        return _lazy_import('.coloring.typewriter_fade', 'TypewriterFadeTemplate')()
     
     def _create_railway_scroll(self) -> TemplateProtocol:
         """RailwayScrollテンプレートを作成"""
-        from .coloring.railway_scroll import RailwayScrollTemplate
-        return RailwayScrollTemplate()
+        return _lazy_import('.coloring.railway_scroll', 'RailwayScrollTemplate')()
     
     def _create_simple_role(self) -> TemplateProtocol:
         """SimpleRoleテンプレートを作成"""
-        from .coloring.simple_role import SimpleRoleTemplate
-        return SimpleRoleTemplate()
+        return _lazy_import('.coloring.simple_role', 'SimpleRoleTemplate')()
 
 
 class Configuration:
     """設定管理クラス"""
     
     def __init__(self):
-        self._settings = {
+        settings = {
             'default_resolution': (1080, 1920),
             'quality_settings': {
                 'crf': 23,
@@ -232,6 +272,10 @@ class Configuration:
                 }
             }
         }
+        # 共有設定は読み取り専用ビューで保持し、参照をそのまま返しても書き換えられないようにする
+        self._settings: Mapping[str, Any] = _freeze_settings(settings)
+        # テンプレート設定はネストした辞書参照を省くため直接保持
+        self._template_settings: Mapping[str, Mapping[str, Any]] = self._settings['template_settings']
     
     def get_default_resolution(self):
         return self._settings['default_resolution']
@@ -240,7 +284,9 @@ class Configuration:
         return self._settings['quality_settings']
     
     def get_template_settings(self, template_name: str):
-        return self._settings['template_settings'].get(template_name, {})
+        # 呼び出し側で update できるよう読み取り専用ビューから辞書を複製して返す
+        settings = self._template_settings.get(template_name)
+        return dict(settings) if settings is not None else {}
 
 
 class ErrorHandler:
@@ -281,28 +327,50 @@ class DependencyInjectedTemplateEngine:
         self.config = Configuration()
         self.error_handler = ErrorHandler()
         self._templates: Dict[str, TemplateProtocol] = {}
+        self._template_factories: Dict[str, Callable[[], TemplateProtocol]] = {}
         
         # デフォルトテンプレートを初期化
         self._initialize_templates()
     
     def _initialize_templates(self):
-        """テンプレートを初期化"""
+        """テンプレートのファクトリーを登録（インスタンスは初回取得時に生成）"""
         template_types = ['typewriter_fade', 'railway_scroll', 'simple_role']
         
-        for template_type in template_types:
-            try:
-                template = self.factory.create_template(template_type)
-                if template:
-                    self._templates[template_type] = template
-            except Exception as e:
-                self.error_handler.log_error(e, f"Failed to initialize template: {template_type}")
+        self._template_factories = {
+            template_type: partial(self.factory.create_template, template_type)
+            for template_type in template_types
+        }
     
     def get_template(self, name: str) -> Optional[TemplateProtocol]:
         """テンプレートを取得"""
-        return self._templates.get(name)
+        template = self._templates.get(name)
+        if template is not None:
+            return template
+        
+        factory = self._template_factories.get(name)
+        if factory is None:
+            return None
+        
+        try:
+            template = factory()
+        except Exception as e:
+            # 生成に失敗したテンプレートは以降の一覧・取得対象から外す
+            del self._template_factories[name]
+            self.error_handler.log_error(e, f"Failed to initialize template: {name}")
+            return None
+        
+        # ファクトリーが生成できなかったテンプレートも一覧から外す
+        del self._template_factories[name]
+        if template is None:
+            return None
+        
+        self._templates[name] = template
+        return template
     
     def list_templates(self) -> List[str]:
         """利用可能なテンプレート一覧を取得"""
+        for name in list(self._template_factories):
+            self.get_template(name)
         return list(self._templates.keys())
     
     def generate_complete_workflow(
@@ -351,7 +419,8 @@ class DependencyInjectedTemplateEngine:
             # メタデータを作成
             from .models.output_models import ASSMetadata
             metadata = ASSMetadata()
-            metadata.line_count = len(ass_content.split('\n'))
+            # 行リストを生成せず改行数から行数を算出
+            metadata.line_count = ass_content.count('\n') + 1
             metadata.character_count = len(ass_content)
             
             ass_output = ASSOutput(
@@ -6,9 +6,91 @@ ScrollCast アセット配信システム
 import os
 import shutil
 import json
-from typing import List, Dict, Set, Optional
+from functools import lru_cache
+from typing import List, Dict, Set, Optional, NamedTuple, Tuple
 from pathlib import Path
 
+# reflink（コピーオンライト複製）用のioctlはPOSIX環境でのみ利用可能
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+# Linux の FICLONE ioctl 番号（btrfs/XFS 等でデータを複製せずにファイルを共有）
+FICLONE = 0x40049409
+
+# reflink 非対応と判明した後は毎回の試行を省く
+_reflink_supported = FCNTL_AVAILABLE
+
+
+def _clone_or_copy_asset(source_path: str, dest_path: str) -> None:
+    """アセットファイルをreflinkで複製し、非対応ならコピー
+    
+    ハードリンクは出力側の編集がソースに波及するため使わない。
+    """
+    global _reflink_supported
+    if _reflink_supported:
+        try:
+            with open(source_path, 'rb') as src, open(dest_path, 'wb') as dst:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            return
+        except OSError:
+            _reflink_supported = False
+    _copy_asset(source_path, dest_path)
+
+
+def _copy_asset(source_path: str, dest_path: str) -> None:
+    """アセットファイルを内容のみコピー
+    
+    生成物にタイムスタンプや権限の引き継ぎは不要なため copystat を省き、
+    shutil.copyfile の OS 高速コピー経路（sendfile 等）に任せる。
+    """
+    shutil.copyfile(source_path, dest_path)
+
+
+@lru_cache(maxsize=None)
+def _plugin_file_name(plugin_name: str) -> str:
+    """プラグイン名からJSファイル名を取得（例: auto_play → auto-play-plugin.js）"""
+    return f"{plugin_name.replace('_', '-')}-plugin.js"
+
+
+# マニフェストファイル名
+MANIFEST_FILE_NAME = "asset-manifest.json"
+
+# アセットのソース署名（ファイルサイズ, 更新時刻ns）
+AssetSignature = Tuple[int, int]
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """バイト列を低レベルI/Oで一度に書き出す（単発の書き込みでバッファ付きファイルオブジェクトを作らない）"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _load_manifest_signatures(output_dir: str) -> Dict[str, AssetSignature]:
+    """前回のマニフェストからアセットのソース署名を読み込み（無い・壊れている場合は空）"""
+    try:
+        with open(os.path.join(output_dir, MANIFEST_FILE_NAME), encoding='utf-8') as f:
+            signatures = json.load(f).get("asset_signatures", {})
+        return {asset: (size, mtime_ns) for asset, (size, mtime_ns) in signatures.items()}
+    except (OSError, ValueError, TypeError, AttributeError):
+        return {}
+
+
+class AssetCopy(NamedTuple):
+    """配信するアセット1件分のコピー計画"""
+    source_path: str
+    dest_path: str
+    asset_key: str  # deployed_assets / マニフェストに記録する名前
+    clone: bool     # reflink を試みる静的アセットか
+    required: bool  # ソースが無い場合に警告するか
+
 
 class FileDeployer:
     """ScrollCast アセットファイル配信クラス"""
@@ -20,33 +102,175 @@ class FileDeployer:
         """
         self.web_source_dir = web_source_dir
         self.deployed_assets: Set[str] = set()
+        # 今回配信したアセットのソース署名（マニフェストに記録）
+        self.asset_signatures: Dict[str, AssetSignature] = {}
+        # 出力ディレクトリごとの前回配信時のソース署名（初回参照時に読み込み）
+        self._previous_signatures: Dict[str, Dict[str, AssetSignature]] = {}
+        # このインスタンスで配信した出力パスとその時点のソース署名（同一実行内の再配信を省く）
+        self._deployed_paths: Dict[str, AssetSignature] = {}
+    
+    def _plan_shared_assets(self, output_dir: str) -> List[AssetCopy]:
+        """共通ライブラリファイルのコピー計画を作成"""
+        lib_dir = os.path.join(output_dir, "lib")
+        lib_source_dir = os.path.join(self.web_source_dir, "lib")
         
-    def deploy_shared_assets(self, output_dir: str) -> bool:
-        """共通ライブラリファイルを配信
+        # ディレクトリは一度だけ結合し、ファイル名は区切り文字で連結
+        sep = os.sep
+        return [
+            AssetCopy(f"{lib_source_dir}{sep}{lib_file}", f"{lib_dir}{sep}{lib_file}", lib_file, True, False)
+            for lib_file in ["scrollcast-styles.css", "scrollcast-core.js"]
+        ]
+    
+    def _plan_plugin_files(self, output_dir: str, required_plugins: List[str]) -> List[AssetCopy]:
+        """プラグインファイルのコピー計画を作成"""
+        plugins_dir = os.path.join(output_dir, "plugins")
+        plugins_source_dir = os.path.join(self.web_source_dir, "plugins")
+        
+        sep = os.sep
+        plan = []
+        for plugin_name in required_plugins:
+            plugin_file = _plugin_file_name(plugin_name)
+            plan.append(AssetCopy(
+                f"{plugins_source_dir}{sep}{plugin_file}", f"{plugins_dir}{sep}{plugin_file}",
+                plugin_file, False, True
+            ))
+        return plan
+    
+    def _plan_template_assets(self, output_dir: str, template_category: str,
+                              template_name: str) -> Optional[List[AssetCopy]]:
+        """テンプレート固有アセットのコピー計画を作成（ソースが無い場合はNone）"""
+        # カテゴリ・テンプレートのディレクトリは一度だけ結合し、配下は区切り文字で連結
+        sep = os.sep
+        source_category_dir = os.path.join(self.web_source_dir, "templates", template_category)
+        source_template_dir = f"{source_category_dir}{sep}{template_name}"
+        
+        # ディレクトリの存在確認と配下ファイルの有無を1回のディレクトリ読み取りで判定
+        try:
+            with os.scandir(source_template_dir) as entries:
+                present_files = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            print(f"⚠️  テンプレートソースが見つかりません: {source_template_dir}")
+            return None
+        
+        output_category_dir = os.path.join(output_dir, "templates", template_category)
+        template_output_dir = f"{output_category_dir}{sep}{template_name}"
+        asset_key_prefix = f"templates/{template_category}/"
+        plan = []
+        
+        # sc-template.css と sc-template.js
+        for asset_file in ["sc-template.css", "sc-template.js"]:
+            if asset_file not in present_files:
+                continue
+            plan.append(AssetCopy(
+                f"{source_template_dir}{sep}{asset_file}", f"{template_output_dir}{sep}{asset_file}",
+                f"{asset_key_prefix}{template_name}/{asset_file}", True, False
+            ))
+        
+        # カテゴリ共通ファイル (sc-base.js)
+        plan.append(AssetCopy(
+            f"{source_category_dir}{sep}sc-base.js", f"{output_category_dir}{sep}sc-base.js",
+            f"{asset_key_prefix}sc-base.js", True, False
+        ))
+        return plan
+    
+    def _is_unchanged(self, copy: AssetCopy, signature: AssetSignature,
+                      previous_signatures: Dict[str, AssetSignature]) -> bool:
+        """前回配信時とソース署名が一致し、配信先も同じサイズで残っているか"""
+        if (self._deployed_paths.get(copy.dest_path) != signature
+                and previous_signatures.get(copy.asset_key) != signature):
+            return False
+        try:
+            return os.stat(copy.dest_path).st_size == signature[0]
+        except OSError:
+            return False
+    
+    def _execute_plan(self, plan: List[AssetCopy], output_dir: str) -> Tuple[int, int]:
+        """コピー計画を実行し、(コピーしたアセット数, 変更なしで省略したアセット数) を返す
+        
+        出力ディレクトリは重複を除いて1度だけ作成し、ソースの有無は事前に確認せず
+        署名取得時の stat で判定する。このインスタンスまたは前回配信時からソースの
+        サイズ・更新時刻が変わらず、配信先も同じサイズで残っているアセットはコピーを省略する。
+        """
+        deployed_keys = []
+        copied_count = 0
+        
+        previous_signatures = self._previous_signatures.get(output_dir)
+        if previous_signatures is None:
+            previous_signatures = _load_manifest_signatures(output_dir)
+            self._previous_signatures[output_dir] = previous_signatures
+        
+        for directory in {os.path.dirname(copy.dest_path) for copy in plan}:
+            os.makedirs(directory, exist_ok=True)
+        
+        for copy in plan:
+            try:
+                source_stat = os.stat(copy.source_path)
+            except FileNotFoundError:
+                if copy.required:
+                    print(f"⚠️  アセットファイルが見つかりません: {copy.source_path}")
+                continue
+            
+            deployed_keys.append(copy.asset_key)
+            signature = (source_stat.st_size, source_stat.st_mtime_ns)
+            self.asset_signatures[copy.asset_key] = signature
+            
+            if not self._is_unchanged(copy, signature, previous_signatures):
+                if copy.clone:
+                    _clone_or_copy_asset(copy.source_path, copy.dest_path)
+                else:
+                    _copy_asset(copy.source_path, copy.dest_path)
+                copied_count += 1
+            self._deployed_paths[copy.dest_path] = signature
+        
+        self.deployed_assets.update(deployed_keys)
+        return copied_count, len(deployed_keys) - copied_count
+    
+    def deploy_all(self, output_dir: str, required_plugins: List[str],
+                   template_category: Optional[str] = None, template_name: Optional[str] = None) -> bool:
+        """共通ライブラリ・プラグイン・テンプレート固有アセットを1回のコピー処理で配信し、マニフェストを作成
         
         Args:
-            output_dir: 出力ディレクトリ (例: output-default/web)
+            output_dir: 出力ディレクトリ
+            required_plugins: 必要なプラグイン名のリスト
+            template_category: テンプレートカテゴリ（省略時はテンプレート固有アセットを配信しない）
+            template_name: テンプレート名
             
         Returns:
             配信成功の可否
         """
         try:
-            lib_dir = os.path.join(output_dir, "lib")
-            os.makedirs(lib_dir, exist_ok=True)
+            plan = self._plan_shared_assets(output_dir)
+            plan.extend(self._plan_plugin_files(output_dir, required_plugins))
             
-            # 静的ファイルからlibディレクトリのファイルをコピー
-            lib_source_dir = os.path.join(self.web_source_dir, "lib")
+            template_plan: Optional[List[AssetCopy]] = []
+            if template_category and template_name:
+                template_plan = self._plan_template_assets(output_dir, template_category, template_name)
+                if template_plan:
+                    plan.extend(template_plan)
             
-            for lib_file in ["scrollcast-styles.css", "scrollcast-core.js"]:
-                source_path = os.path.join(lib_source_dir, lib_file)
-                dest_path = os.path.join(lib_dir, lib_file)
-                
-                if os.path.exists(source_path):
-                    shutil.copy2(source_path, dest_path)
-                    self.deployed_assets.add(lib_file)
+            copied_count, skipped_count = self._execute_plan(plan, output_dir)
+            print(f"✅ アセット配信完了: {copied_count}ファイル（変更なし: {skipped_count}ファイル）")
             
+        except Exception as e:
+            print(f"❌ アセット配信失敗: {e}")
+            return False
+        
+        self.create_asset_manifest(output_dir)
+        return template_plan is not None
+        
+    def deploy_shared_assets(self, output_dir: str) -> bool:
+        """共通ライブラリファイルを配信
+        
+        Args:
+            output_dir: 出力ディレクトリ (例: output-default/web)
             
-            print(f"✅ 共通ライブラリ配信完了: {lib_dir}")
+        Returns:
+            配信成功の可否
+        """
+        try:
+            self._execute_plan(self._plan_shared_assets(output_dir), output_dir)
+            
+            print(f"✅ 共通ライブラリ配信完了: {os.path.join(output_dir, 'lib')}")
             return True
             
         except Exception as e:
@@ -64,20 +288,7 @@ class FileDeployer:
             配信成功の可否
         """
         try:
-            plugins_dir = os.path.join(output_dir, "plugins")
-            os.makedirs(plugins_dir, exist_ok=True)
-            plugins_source_dir = os.path.join(self.web_source_dir, "plugins")
-            
-            for plugin_name in required_plugins:
-                plugin_file = f"{plugin_name.replace('_', '-')}-plugin.js"
-                source_path = os.path.join(plugins_source_dir, plugin_file)
-                dest_path = os.path.join(plugins_dir, plugin_file)
-                
-                if os.path.exists(source_path):
-                    shutil.copy2(source_path, dest_path)
-                    self.deployed_assets.add(plugin_file)
-                else:
-                    print(f"⚠️  プラグインファイルが見つかりません: {source_path}")
+            self._execute_plan(self._plan_plugin_files(output_dir, required_plugins), output_dir)
             
             print(f"✅ プラグインファイル配信完了: {len(required_plugins)}個")
             return True
@@ -98,33 +309,11 @@ class FileDeployer:
             配信成功の可否
         """
         try:
-            # 出力先のテンプレートディレクトリ
-            template_output_dir = os.path.join(output_dir, "templates", template_category, template_name)
-            os.makedirs(template_output_dir, exist_ok=True)
-            
-            # ソースディレクトリ
-            source_template_dir = os.path.join(self.web_source_dir, "templates", template_category, template_name)
-            
-            if not os.path.exists(source_template_dir):
-                print(f"⚠️  テンプレートソースが見つかりません: {source_template_dir}")
+            plan = self._plan_template_assets(output_dir, template_category, template_name)
+            if plan is None:
                 return False
             
-            # sc-template.css と sc-template.js をコピー
-            for asset_file in ["sc-template.css", "sc-template.js"]:
-                source_path = os.path.join(source_template_dir, asset_file)
-                if os.path.exists(source_path):
-                    dest_path = os.path.join(template_output_dir, asset_file)
-                    shutil.copy2(source_path, dest_path)
-                    self.deployed_assets.add(f"templates/{template_category}/{template_name}/{asset_file}")
-            
-            # カテゴリ共通ファイル (sc-base.js) をコピー
-            category_base_source = os.path.join(self.web_source_dir, "templates", template_category, "sc-base.js")
-            if os.path.exists(category_base_source):
-                category_output_dir = os.path.join(output_dir, "templates", template_category)
-                os.makedirs(category_output_dir, exist_ok=True)
-                dest_path = os.path.join(category_output_dir, "sc-base.js")
-                shutil.copy2(category_base_source, dest_path)
-                self.deployed_assets.add(f"templates/{template_category}/sc-base.js")
+            self._execute_plan(plan, output_dir)
             
             print(f"✅ テンプレートアセット配信完了: {template_category}/{template_name}")
             return True
@@ -133,6 +322,38 @@ class FileDeployer:
             print(f"❌ テンプレートアセット配信失敗: {e}")
             return False
     
+    def sync_template_assets_batch(self, output_dir: str, templates: List[Tuple[str, str]]) -> bool:
+        """複数テンプレートの固有アセットを1回のコピー処理で配信
+        
+        Args:
+            output_dir: 出力ディレクトリ
+            templates: (テンプレートカテゴリ, テンプレート名) のリスト
+            
+        Returns:
+            全テンプレートの配信成功の可否
+        """
+        try:
+            all_found = True
+            # 同一カテゴリの sc-base.js は出力パスで重複を除く
+            plan: Dict[str, AssetCopy] = {}
+            for template_category, template_name in templates:
+                template_plan = self._plan_template_assets(output_dir, template_category, template_name)
+                if template_plan is None:
+                    all_found = False
+                    continue
+                for copy in template_plan:
+                    plan.setdefault(copy.dest_path, copy)
+            
+            copied_count, skipped_count = self._execute_plan(list(plan.values()), output_dir)
+            
+            print(f"✅ テンプレートアセット配信完了: {len(templates)}テンプレート / "
+                  f"{copied_count}ファイル（変更なし: {skipped_count}ファイル）")
+            return all_found
+            
+        except Exception as e:
+            print(f"❌ テンプレートアセット配信失敗: {e}")
+            return False
+    
     def create_asset_manifest(self, output_dir: str) -> bool:
         """配信されたアセットのマニフェストファイルを作成
         
@@ -143,15 +364,20 @@ class FileDeployer:
             作成成功の可否
         """
         try:
+            # 出力が実行ごとに揺れないよう資産名はソートして記録
             manifest = {
-                "deployed_assets": list(self.deployed_assets),
+                "deployed_assets": sorted(self.deployed_assets),
                 "deployment_timestamp": os.path.getctime(output_dir) if os.path.exists(output_dir) else None,
-                "total_files": len(self.deployed_assets)
+                "total_files": len(self.deployed_assets),
+                "asset_signatures": dict(sorted(self.asset_signatures.items()))
             }
             
-            manifest_path = os.path.join(output_dir, "asset-manifest.json")
-            with open(manifest_path, 'w', encoding='utf-8') as f:
-                json.dump(manifest, f, indent=2, ensure_ascii=False)
+            manifest_path = os.path.join(output_dir, MANIFEST_FILE_NAME)
+            manifest_json = json.dumps(manifest, indent=2, ensure_ascii=False)
+            _write_bytes(manifest_path, manifest_json.encode('utf-8'))
+            
+            # 同一プロセス内での再配信も今回の署名を基準に判定
+            self._previous_signatures[output_dir] = dict(self.asset_signatures)
             
             print(f"✅ アセットマニフェスト作成完了: {manifest_path}")
             return True
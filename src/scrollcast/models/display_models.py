@@ -4,9 +4,13 @@ Display Models
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Tuple, Optional
 from enum import Enum
 
+# プリセット設定キャッシュの最大エントリ数（フォントサイズ違いを想定）
+PRESET_CACHE_MAX_SIZE = 32
+
 
 class ResolutionPreset(Enum):
     """解像度プリセット"""
@@ -17,7 +21,7 @@ class ResolutionPreset(Enum):
     SQUARE = "1080x1080"             # Instagram投稿
 
 
-@dataclass
+@dataclass(frozen=True)
 class Resolution:
     """解像度設定"""
     width: int
@@ -52,7 +56,7 @@ class Resolution:
         return self.height > self.width
 
 
-@dataclass
+@dataclass(frozen=True)
 class FontConfig:
     """フォント設定"""
     size: int
@@ -86,9 +90,9 @@ class FontConfig:
         }
 
 
-@dataclass
+@dataclass(frozen=True)
 class DisplayConfig:
-    """表示設定の統一管理クラス"""
+    """表示設定の統一管理クラス（プリセットを共有キャッシュするため不変）"""
     
     # 基本設定
     resolution: Resolution
@@ -118,12 +122,12 @@ class DisplayConfig:
     
     def __post_init__(self):
         """初期化後の処理"""
-        # 自動計算が必要な値を設定
+        # 自動計算が必要な値を設定（frozen のため object.__setattr__ で初期化）
         if self.max_chars_per_line is None:
-            self.max_chars_per_line = self._calculate_max_chars_per_line()
+            object.__setattr__(self, 'max_chars_per_line', self._calculate_max_chars_per_line())
         
         if self.max_lines_per_screen is None:
-            self.max_lines_per_screen = self._calculate_max_lines_per_screen()
+            object.__setattr__(self, 'max_lines_per_screen', self._calculate_max_lines_per_screen())
     
     def _calculate_max_chars_per_line(self) -> int:
         """1行の最大文字数を計算"""
@@ -152,8 +156,9 @@ class DisplayConfig:
         """既存コード互換性: font_size直接アクセス"""
         return self.font.size
     
-    # ファクトリメソッド
+    # ファクトリメソッド（同一引数では生成済みの不変インスタンスを返す）
     @classmethod
+    @lru_cache(maxsize=PRESET_CACHE_MAX_SIZE)
     def create_mobile_portrait(cls, font_size: int = 64) -> 'DisplayConfig':
         """モバイル縦画面用の設定を作成"""
         return cls(
@@ -164,6 +169,7 @@ class DisplayConfig:
         )
     
     @classmethod
+    @lru_cache(maxsize=PRESET_CACHE_MAX_SIZE)
     def create_desktop(cls, font_size: int = 48) -> 'DisplayConfig':
         """デスクトップ用の設定を作成"""
         return cls(
@@ -174,6 +180,7 @@ class DisplayConfig:
         )
     
     @classmethod
+    @lru_cache(maxsize=PRESET_CACHE_MAX_SIZE)
     def create_mobile_landscape(cls, font_size: int = 48) -> 'DisplayConfig':
         """モバイル横画面用の設定を作成"""
         return cls(
@@ -186,6 +193,13 @@ class DisplayConfig:
     @classmethod
     def from_legacy_params(cls, resolution: Tuple[int, int], font_size: int = 64) -> 'DisplayConfig':
         """既存のパラメータ形式から作成（互換性維持）"""
+        # リスト等で渡されてもキャッシュキーにできるようタプル化
+        return cls._from_legacy_params_cached(tuple(resolution), font_size)
+    
+    @classmethod
+    @lru_cache(maxsize=PRESET_CACHE_MAX_SIZE)
+    def _from_legacy_params_cached(cls, resolution: Tuple[int, int], font_size: int) -> 'DisplayConfig':
+        """from_legacy_params の生成結果をキャッシュ"""
         return cls(
             resolution=Resolution(width=resolution[0], height=resolution[1]),
             font=FontConfig(size=font_size)
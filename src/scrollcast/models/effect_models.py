@@ -7,6 +7,7 @@ from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional, Union, Tuple
 from enum import Enum
 import math
+from operator import attrgetter
 
 
 class EasingType(Enum):
@@ -466,7 +467,7 @@ class EffectConfig:
         """プライマリエフェクトを取得"""
         if not self.effects:
             return None
-        return max(self.effects, key=lambda e: e.priority)
+        return max(self.effects, key=attrgetter('priority'))
     
     def validate_all(self) -> Dict[str, List[str]]:
         """全エフェクトを検証"""
@@ -612,7 +613,7 @@ def merge_timing_info(timings: List[TimingInfo], overlap_threshold: float = 0.1)
         return []
     
     # 開始時間でソート
-    sorted_timings = sorted(timings, key=lambda t: t.start_time)
+    sorted_timings = sorted(timings, key=attrgetter('start_time'))
     merged = [sorted_timings[0]]
     
     for current in sorted_timings[1:]:
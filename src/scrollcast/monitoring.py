@@ -195,8 +195,9 @@ class PerformanceMonitor:
     
     def record_metric(self, name: str, value: float, metric_type: MetricType, metadata: Optional[Dict[str, Any]] = None):
         """メトリクスを記録"""
+        now = datetime.now()
         point = MetricPoint(
-            timestamp=datetime.now(),
+            timestamp=now,
             metric_name=name,
             value=value,
             metric_type=metric_type,
@@ -206,9 +207,10 @@ class PerformanceMonitor:
         with self.lock:
             self.metrics.append(point)
             
-            # 古いデータを削除（24時間分保持）
-            cutoff = datetime.now() - timedelta(hours=24)
-            self.metrics = [m for m in self.metrics if m.timestamp > cutoff]
+            # 古いデータを削除（24時間分保持。時刻順に追加されるため先頭が期限内なら走査しない）
+            cutoff = now - timedelta(hours=24)
+            if self.metrics[0].timestamp <= cutoff:
+                self.metrics = [m for m in self.metrics if m.timestamp > cutoff]
         
         # 閾値チェック
         self._check_threshold(name, value)
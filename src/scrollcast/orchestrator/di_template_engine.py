@@ -268,7 +268,8 @@ class DITemplateEngine:
             # メタデータを作成
             from ..models.output_models import ASSMetadata
             metadata = ASSMetadata()
-            metadata.line_count = len(ass_content.split('\n'))
+            # 行リストを生成せず改行数から行数を算出
+            metadata.line_count = ass_content.count('\n') + 1
             metadata.character_count = len(ass_content)
             
             ass_output = ASSOutput(
@@ -8,6 +8,8 @@
 // ============================================================================
 window.AutoPlayPlugin = {
     name: 'auto_play',
+    // sequence_start購読者（DOMイベントを介さず直接呼び出す）
+    _seqHandlers: [],
     
     initialize: function(config) {
         console.log('[AutoPlay] Initializing with config:', config);
@@ -18,6 +20,7 @@ window.AutoPlayPlugin = {
             startTime: null
         };
         this.timeline = [];
+        this.nextEventIdx = 0;
         this.setupTimeline();
         this.setupAutoPlay();
         console.log('[AutoPlay] Initialization complete');
@@ -60,8 +63,13 @@ window.AutoPlayPlugin = {
             }
         });
         
-        // 総時間を正しく計算
-        if (this.config.timingData.length > 0) {
+        // カーソル走査のため時刻順に整列
+        this.timeline.sort((a, b) => a.time - b.time);
+        
+        // 総時間を正しく計算（事前計算済みの値があれば優先）
+        if (this.config.totalDuration !== undefined) {
+            this.totalDuration = this.config.totalDuration;
+        } else if (this.config.timingData.length > 0) {
             const lastSequence = this.config.timingData[this.config.timingData.length - 1];
             
             // 明示的な終了時間があればそれを使用
@@ -122,21 +130,26 @@ window.AutoPlayPlugin = {
     },
     
     processTimelineEvents: function(currentTime) {
-        // 未実行のイベントを検索して実行
-        this.timeline.forEach(event => {
-            if (!event.executed && currentTime >= event.time) {
-                console.log(`[AutoPlay] Executing event at ${event.time}ms: sequence ${event.index}`);
-                event.executed = true;
-                
-                if (event.type === 'sequence_start') {
-                    this.dispatchEvent('sequence_start', {
-                        index: event.index,
-                        data: event.data,
-                        globalTime: currentTime
-                    });
-                }
+        // 到達済みのイベントだけカーソルを進めて実行
+        while (this.nextEventIdx < this.timeline.length &&
+               currentTime >= this.timeline[this.nextEventIdx].time) {
+            const event = this.timeline[this.nextEventIdx++];
+            console.log(`[AutoPlay] Executing event at ${event.time}ms: sequence ${event.index}`);
+            
+            if (event.type === 'sequence_start') {
+                const detail = {
+                    index: event.index,
+                    data: event.data,
+                    globalTime: currentTime,
+                    source: 'auto_play'
+                };
+                this._seqHandlers.forEach(handler => handler(detail));
             }
-        });
+        }
+    },
+    
+    onSequenceStart: function(handler) {
+        this._seqHandlers.push(handler);
     },
     
     dispatchEvent: function(eventType, detail = {}) {
@@ -165,6 +178,18 @@ window.ScrollCastBase = {
         console.log('[ScrollCastBase] Common initialization complete');
     },
     
+    // sequence_start を一度だけ購読（AutoPlayPlugin が無い場合は window イベントで受信）
+    subscribeSequenceStart: function(handler) {
+        if (this._sequenceSubscribed) return;
+        this._sequenceSubscribed = true;
+        const autoPlay = window.AutoPlayPlugin;
+        if (autoPlay && autoPlay.onSequenceStart) {
+            autoPlay.onSequenceStart(handler);
+        } else {
+            window.addEventListener('sequence_start', (event) => handler(event.detail));
+        }
+    },
+    
     // 共通イベントハンドラー設定
     setupCommonEventHandlers: function() {
         // 共通のキーボードイベントなど
@@ -6,6 +6,8 @@
 window.ScrollCastCore = {
     version: '2.0.0',
     plugins: {},
+    // sequence_start を購読済みのプラグイン（再初期化時の二重購読を防ぐ）
+    _sequenceSubscribers: new WeakSet(),
     
     registerPlugin: function(name, plugin) {
         this.plugins[name] = plugin;
@@ -21,6 +23,11 @@ window.ScrollCastCore = {
                         ...config,
                         ...config.plugin_configs[pluginName]
                     });
+                    // 表示プラグインの sequence_start ハンドラーを一度だけ購読
+                    if (plugin.handleSequenceStart && !this._sequenceSubscribers.has(plugin)) {
+                        this._sequenceSubscribers.add(plugin);
+                        this.subscribeSequenceStart(detail => plugin.handleSequenceStart(detail));
+                    }
                     console.log(`[ScrollCast] Plugin initialized: ${pluginName}`);
                 } catch (error) {
                     console.error(`[ScrollCast] Plugin initialization failed: ${pluginName}`, error);
@@ -31,6 +38,16 @@ window.ScrollCastCore = {
         }
     },
     
+    // sequence_start を購読（AutoPlayPlugin の直接呼び出しが無い場合は window イベントで受信）
+    subscribeSequenceStart: function(handler) {
+        const autoPlay = window.AutoPlayPlugin;
+        if (autoPlay && autoPlay.onSequenceStart) {
+            autoPlay.onSequenceStart(handler);
+        } else {
+            window.addEventListener('sequence_start', (event) => handler(event.detail));
+        }
+    },
+    
     _getPluginGlobalName: function(pluginName) {
         // auto_play -> AutoPlayPlugin
         return pluginName.split('_').map(word => 
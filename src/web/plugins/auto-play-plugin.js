@@ -5,6 +5,8 @@
 
 window.AutoPlayPlugin = {
     name: 'auto_play',
+    // sequence_start購読者（DOMイベントを介さず直接呼び出す）
+    _seqHandlers: [],
     
     initialize: function(config) {
         this.config = config;
@@ -14,6 +16,7 @@ window.AutoPlayPlugin = {
             startTime: null
         };
         this.timeline = [];
+        this.nextEventIdx = 0;
         this.setupTimeline();
         this.setupAutoPlay();
     },
@@ -70,15 +73,17 @@ window.AutoPlayPlugin = {
         
         this.state.globalTime = Date.now() - this.state.startTime;
         
-        this.timeline.forEach(event => {
-            if (event.time <= this.state.globalTime && !event.triggered) {
-                event.triggered = true;
-                window.dispatchEvent(new CustomEvent(event.type, {
-                    detail: { index: event.index, data: event.data }
-                }));
-            }
-        });
+        while (this.nextEventIdx < this.timeline.length &&
+               this.timeline[this.nextEventIdx].time <= this.state.globalTime) {
+            const event = this.timeline[this.nextEventIdx++];
+            const detail = { index: event.index, data: event.data };
+            this._seqHandlers.forEach(handler => handler(detail));
+        }
         
         requestAnimationFrame(() => this.updateLoop());
+    },
+    
+    onSequenceStart: function(handler) {
+        this._seqHandlers.push(handler);
     }
 };
\ No newline at end of file
@@ -11,14 +11,12 @@ window.RailwayDisplayPlugin = {
         this.lines = document.querySelectorAll('.text-line');
         this.currentLineIndex = 0;
         this.activeAnimations = new Map();
-        this.setupDisplayHandlers();
         this.initializeDisplay();
     },
     
-    setupDisplayHandlers: function() {
-        window.addEventListener('sequence_start', (event) => {
-            this.playSequence(event.detail.index, event.detail.data);
-        });
+    // sequence_start ハンドラー（購読は ScrollCastCore.initializePlugins が行う）
+    handleSequenceStart: function(detail) {
+        this.playSequence(detail.index, detail.data);
     },
     
     initializeDisplay: function() {
@@ -74,14 +72,7 @@ window.RailwayDisplayPlugin = {
                     line.style.transform = 'translate(-50%, -50%) translateY(0px)';
                 }
             },
-            {
-                name: 'static',
-                keyframes: [
-                    { opacity: 1, transform: 'translate(-50%, -50%) translateY(0px)', offset: 0 },
-                    { opacity: 1, transform: 'translate(-50%, -50%) translateY(0px)', offset: 1 }
-                ],
-                options: { duration: staticDuration, delay: staticStart, fill: 'forwards', easing: 'linear' }
-            },
+            // 静止表示はfade-inのfill: 'forwards'で保持し、fade-outを遅延開始
             {
                 name: 'fade-out',
                 keyframes: [
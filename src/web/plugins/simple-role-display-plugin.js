@@ -9,14 +9,12 @@ window.SimpleRoleDisplayPlugin = {
     initialize: function(config) {
         this.config = config;
         this.lines = document.querySelectorAll('.text-line');
-        this.setupDisplayHandlers();
         this.initializeDisplay();
     },
     
-    setupDisplayHandlers: function() {
-        window.addEventListener('sequence_start', (event) => {
-            this.playSequence(event.detail.index, event.detail.data);
-        });
+    // sequence_start ハンドラー（購読は ScrollCastCore.initializePlugins が行う）
+    handleSequenceStart: function(detail) {
+        this.playSequence(detail.index, detail.data);
     },
     
     initializeDisplay: function() {
@@ -11,24 +11,22 @@ window.TypewriterDisplayPlugin = {
         this.config = config;
         this.sentences = document.querySelectorAll('.text-container[data-template="typewriter"] .text-sentence, .text-container[data-template="typewriter"] .typewriter-sentence, .typewriter-sentence');
         console.log('[DEBUG] Found', this.sentences.length, 'sentence elements');
-        this.setupDisplayHandlers();
+        // 文ごとの文字要素を一度だけ取得してキャッシュ
+        this.sentenceChars = Array.from(this.sentences, sentence => sentence.querySelectorAll('.text-char, .typewriter-char'));
         this.initializeDisplay();
         console.log('[DEBUG] TypewriterDisplayPlugin initialization complete');
     },
     
-    setupDisplayHandlers: function() {
-        console.log('[DEBUG] setupDisplayHandlers() called');
-        window.addEventListener('sequence_start', (event) => {
-            console.log('[DEBUG] sequence_start event received:', event.detail);
-            this.playSequence(event.detail.index, event.detail.data);
-        });
-        console.log('[DEBUG] Event listeners set up');
+    // sequence_start ハンドラー（購読は ScrollCastCore.initializePlugins が行う）
+    handleSequenceStart: function(detail) {
+        console.log('[DEBUG] sequence_start event received:', detail);
+        this.playSequence(detail.index, detail.data);
     },
     
     initializeDisplay: function() {
-        this.sentences.forEach(sentence => {
+        this.sentences.forEach((sentence, index) => {
             sentence.style.display = 'none';
-            const chars = sentence.querySelectorAll('.text-char, .typewriter-char');
+            const chars = this.sentenceChars[index];
             chars.forEach(char => {
                 char.style.opacity = '0';
                 char.style.transform = 'scale(0.8)';
@@ -50,10 +48,10 @@ window.TypewriterDisplayPlugin = {
         }
         
         console.log('[DEBUG] Animating sentence:', sentence.textContent);
-        this.animateTypewriter(sentence, sequenceData);
+        this.animateTypewriter(sentence, sequenceData, sequenceIndex);
     },
     
-    animateTypewriter: function(sentence, sequenceData) {
+    animateTypewriter: function(sentence, sequenceData, sequenceIndex) {
         console.log('[DEBUG] Starting typewriter animation for sentence:', sentence.textContent);
         console.log('[DEBUG] Full sequenceData:', sequenceData);
         
@@ -63,7 +61,7 @@ window.TypewriterDisplayPlugin = {
         sentence.style.display = 'block';
         sentence.classList.add('active');
         
-        const chars = sentence.querySelectorAll('.typewriter-char');
+        const chars = this.sentenceChars[sequenceIndex];
         const characterTimings = sequenceData.character_timings || sequenceData.chars || [];
         
         console.log('[DEBUG] Found', chars.length, 'characters, timings length:', characterTimings.length);
@@ -85,11 +83,11 @@ window.TypewriterDisplayPlugin = {
     
     clearPreviousSentences: function(currentSentence) {
         console.log('[DEBUG] Clearing previous sentences');
-        this.sentences.forEach(sentence => {
+        this.sentences.forEach((sentence, index) => {
             if (sentence !== currentSentence) {
                 sentence.style.display = 'none';
                 sentence.classList.remove('active');
-                const chars = sentence.querySelectorAll('.text-char, .typewriter-char');
+                const chars = this.sentenceChars[index];
                 chars.forEach(char => {
                     char.style.opacity = '0';
                     char.style.transform = 'scale(0.8)';
@@ -22,9 +22,9 @@ window.RailwayBase = Object.assign({}, window.ScrollCastBase, {
     // Railway系共通イベントハンドラー
     setupRailwayEventHandlers: function() {
         console.log('[RailwayBase] Setting up railway event handlers');
-        window.addEventListener('sequence_start', (event) => {
-            console.log('[RailwayBase] Received sequence_start event:', event.detail);
-            this.playSequence(event.detail.index, event.detail.data);
+        this.subscribeSequenceStart((detail) => {
+            console.log('[RailwayBase] Received sequence_start:', detail);
+            this.playSequence(detail.index, detail.data);
         });
     },
     
@@ -25,9 +25,9 @@ window.ScrollBase = Object.assign({}, window.ScrollCastBase, {
     // Scroll系共通イベントハンドラー
     setupScrollEventHandlers: function() {
         console.log('[ScrollBase] Setting up scroll event handlers');
-        window.addEventListener('sequence_start', (event) => {
-            console.log('[ScrollBase] Received sequence_start event:', event.detail);
-            this.showLine(event.detail.index);
+        this.subscribeSequenceStart((detail) => {
+            console.log('[ScrollBase] Received sequence_start:', detail);
+            this.showLine(detail.index);
         });
     },
     
@@ -12,6 +12,8 @@ window.TypewriterBase = Object.assign({}, window.ScrollCastBase, {
         this.initializeCommon(config);
         this.sentences = document.querySelectorAll('.typewriter-sentence');
         console.log(`[TypewriterBase] Found ${this.sentences.length} sentences`);
+        // 文ごとの文字要素を一度だけ取得してキャッシュ
+        this.sentenceChars = Array.from(this.sentences, sentence => sentence.querySelectorAll('.typewriter-char'));
         this.currentSentenceIndex = -1;
         this.setupTypewriterEventHandlers();
         this.initializeTypewriterDisplay();
@@ -21,9 +23,9 @@ window.TypewriterBase = Object.assign({}, window.ScrollCastBase, {
     // Typewriter系共通イベントハンドラー
     setupTypewriterEventHandlers: function() {
         console.log('[TypewriterBase] Setting up typewriter event handlers');
-        window.addEventListener('sequence_start', (event) => {
-            console.log('[TypewriterBase] Received sequence_start event:', event.detail);
-            this.playSequence(event.detail.index, event.detail.data);
+        this.subscribeSequenceStart((detail) => {
+            console.log('[TypewriterBase] Received sequence_start:', detail);
+            this.playSequence(detail.index, detail.data);
         });
     },
     
@@ -32,7 +34,7 @@ window.TypewriterBase = Object.assign({}, window.ScrollCastBase, {
         // 全ての文を非表示に初期化
         this.sentences.forEach((sentence, index) => {
             sentence.classList.remove('active');
-            const chars = sentence.querySelectorAll('.typewriter-char');
+            const chars = this.sentenceChars[index];
             chars.forEach(char => {
                 char.style.opacity = '0';
                 char.classList.remove('visible');
@@ -99,7 +101,7 @@ window.TypewriterBase = Object.assign({}, window.ScrollCastBase, {
     // 文字アニメーション（サブクラスでオーバーライド）
     animateCharacters: function(sentence, sequenceData, sequenceIndex) {
         console.log('[TypewriterBase] Base character animation - should be overridden by subclass');
-        const chars = sentence.querySelectorAll('.typewriter-char');
+        const chars = this.sentenceChars[sequenceIndex];
         
         // デフォルトの基本アニメーション
         chars.forEach((char, index) => {
@@ -111,8 +113,10 @@ window.TypewriterBase = Object.assign({}, window.ScrollCastBase, {
     },
     
     // 文字要素の取得と初期化（共通ユーティリティ）
-    initializeCharacters: function(sentence) {
-        const chars = sentence.querySelectorAll('.typewriter-char');
+    initializeCharacters: function(sentence, sequenceIndex) {
+        const chars = sequenceIndex !== undefined && this.sentenceChars
+            ? this.sentenceChars[sequenceIndex]
+            : sentence.querySelectorAll('.typewriter-char');
         chars.forEach(char => {
             char.style.opacity = '0';
             char.classList.remove('visible');
@@ -24,7 +24,7 @@ window.TypewriterFadePlugin = Object.assign({}, window.TypewriterBase, {
     
     // 文字アニメーション（フェード効果）をオーバーライド
     animateCharacters: function(sentence, sequenceData, sequenceIndex) {
-        const chars = this.initializeCharacters(sentence);
+        const chars = this.initializeCharacters(sentence, sequenceIndex);
         console.log(`[TypewriterFade] Found ${chars.length} characters in sentence ${sequenceIndex}`);
         
         if (chars.length === 0) {
@@ -0,0 +1,68 @@
+"""
+FileDeployer のテスト（マニフェスト出力と再配信判定）
+"""
+
+import json
+import os
+
+import pytest
+
+from scrollcast.deployment.file_deployer import FileDeployer, MANIFEST_FILE_NAME
+
+
+def _write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+@pytest.fixture
+def web_source_dir(tmp_path):
+    """最小構成のWeb静的ファイルソース"""
+    source = tmp_path / "web"
+    _write(str(source / "lib" / "scrollcast-styles.css"), "body {}\n")
+    _write(str(source / "lib" / "scrollcast-core.js"), "// core\n")
+    _write(str(source / "plugins" / "auto-play-plugin.js"), "// auto play\n")
+    _write(str(source / "templates" / "scroll" / "sc-base.js"), "// base\n")
+    _write(str(source / "templates" / "scroll" / "scroll_role" / "sc-template.css"), "/* role */\n")
+    return str(source)
+
+
+def test_manifest_output(web_source_dir, tmp_path):
+    output_dir = str(tmp_path / "out")
+    deployer = FileDeployer(web_source_dir)
+    assert deployer.deploy_all(output_dir, ["auto_play"], "scroll", "scroll_role")
+
+    with open(os.path.join(output_dir, MANIFEST_FILE_NAME), encoding='utf-8') as f:
+        raw = f.read()
+    manifest = json.loads(raw)
+
+    expected_assets = sorted([
+        "auto-play-plugin.js",
+        "scrollcast-core.js",
+        "scrollcast-styles.css",
+        "templates/scroll/sc-base.js",
+        "templates/scroll/scroll_role/sc-template.css",
+    ])
+    assert manifest["deployed_assets"] == expected_assets
+    assert manifest["total_files"] == len(expected_assets)
+    assert sorted(manifest["asset_signatures"]) == expected_assets
+    assert raw == json.dumps(manifest, indent=2, ensure_ascii=False)
+
+
+def test_redeploys_changed_source_and_missing_destination(web_source_dir, tmp_path):
+    output_dir = str(tmp_path / "out")
+    deployer = FileDeployer(web_source_dir)
+    deployer.deploy_all(output_dir, ["auto_play"])
+
+    # 同一インスタンスでもソース変更・配信先削除は再配信される
+    core_source = os.path.join(web_source_dir, "lib", "scrollcast-core.js")
+    _write(core_source, "// core v2 with more content\n")
+    plugin_dest = os.path.join(output_dir, "plugins", "auto-play-plugin.js")
+    os.remove(plugin_dest)
+
+    deployer.deploy_all(output_dir, ["auto_play"])
+
+    with open(os.path.join(output_dir, "lib", "scrollcast-core.js"), encoding='utf-8') as f:
+        assert f.read() == "// core v2 with more content\n"
+    assert os.path.exists(plugin_dest)
@@ -0,0 +1,37 @@
+"""
+HierarchicalTemplateConverter のテスト（字幕テキストのHTMLエスケープ）
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from scrollcast.conversion.hierarchical_template_converter import HierarchicalTemplateConverter
+
+RAW_TEXT = '<b>Tom & "Jerry"</b>'
+ESCAPED_TEXT = '&lt;b&gt;Tom &amp; "Jerry"&lt;/b&gt;'
+
+
+@pytest.mark.parametrize("template_name, build_html", [
+    ("railway_scroll", "_generate_railway_lines_html_from_converter"),
+    ("simple_role", "_generate_simple_role_lines_html_from_converter"),
+])
+def test_line_text_is_escaped(template_name, build_html):
+    converter = HierarchicalTemplateConverter(template_name)
+    converter.data_converter.line_timings = [SimpleNamespace(text=RAW_TEXT)]
+
+    html = getattr(converter, build_html)()
+
+    assert ESCAPED_TEXT in html
+    assert "<b>" not in html
+
+
+def test_typewriter_chars_are_escaped():
+    converter = HierarchicalTemplateConverter("typewriter_fade")
+    converter.data_converter.sentence_timings = [[SimpleNamespace(char=c) for c in "<& "]]
+
+    html = converter._generate_typewriter_sentences_html()
+
+    assert '<span class="typewriter-char">&lt;</span>' in html
+    assert '<span class="typewriter-char">&amp;</span>' in html
+    assert '<span class="typewriter-char">&nbsp;</span>' in html
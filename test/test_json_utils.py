@@ -0,0 +1,40 @@
+"""
+JSONUtils のテスト（orjson利用時と標準jsonフォールバック時で出力が一致すること）
+"""
+
+import json
+
+import pytest
+
+from scrollcast.conversion import utils
+from scrollcast.conversion.utils import JSONUtils
+
+SAMPLE = {"text": "こんにちは \"world\"", "start_time": 0, "duration": 1500, "nested": {"b": 1, "a": [1, 2]}}
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    """orjson と標準json の両方でテストを実行"""
+    if request.param == "orjson":
+        if not utils.ORJSON_AVAILABLE:
+            pytest.skip("orjson が未インストール")
+    else:
+        monkeypatch.setattr(utils, "ORJSON_AVAILABLE", False)
+    return request.param
+
+
+def test_dumps_is_compact_and_keeps_non_ascii(json_backend):
+    assert JSONUtils.dumps(SAMPLE) == json.dumps(SAMPLE, ensure_ascii=False, separators=(',', ':'))
+
+
+def test_dumps_sort_keys(json_backend):
+    expected = json.dumps(SAMPLE, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+    assert JSONUtils.dumps(SAMPLE, sort_keys=True) == expected
+
+
+def test_dumps_pretty(json_backend):
+    assert JSONUtils.dumps(SAMPLE, pretty=True) == json.dumps(SAMPLE, ensure_ascii=False, indent=2)
+
+
+def test_dumps_bytes_matches_dumps(json_backend):
+    assert JSONUtils.dumps_bytes(SAMPLE) == JSONUtils.dumps(SAMPLE).encode('utf-8')
@@ -0,0 +1,42 @@
+"""
+PluginConverterBase のテスト（ASSファイル読み込み時の改行コード正規化）
+"""
+
+import pytest
+
+from scrollcast.conversion.typewriter_pop_plugin_converter import TypewriterPopPluginConverter
+
+
+@pytest.mark.parametrize("raw, expected", [
+    (b"[Script Info]\nTitle: a\n", "[Script Info]\nTitle: a\n"),
+    (b"[Script Info]\r\nTitle: a\r\n", "[Script Info]\nTitle: a\n"),
+    (b"[Script Info]\rTitle: a\r", "[Script Info]\nTitle: a\n"),
+    (b"[Script Info]\r\nTitle: a\rStyle: b\n", "[Script Info]\nTitle: a\nStyle: b\n"),
+    ("Title: こんにちは\r\n".encode('utf-8'), "Title: こんにちは\n"),
+])
+def test_read_ass_file_content_normalizes_newlines(tmp_path, raw, expected):
+    ass_path = tmp_path / "sample.ass"
+    ass_path.write_bytes(raw)
+
+    assert TypewriterPopPluginConverter().read_ass_file_content(str(ass_path)) == expected
+
+
+def test_generate_html_rejects_empty_data_before_building_parts(tmp_path, monkeypatch):
+    def fail(self):
+        raise AssertionError("テンプレートHTMLが構築された")
+
+    monkeypatch.setattr(TypewriterPopPluginConverter, "_build_template_html", fail)
+
+    with pytest.raises(ValueError):
+        TypewriterPopPluginConverter().generate_html(str(tmp_path / "out.html"))
+
+
+def test_parse_timings_stores_escaped_text_and_keeps_raw_text_for_json():
+    converter = TypewriterPopPluginConverter()
+    converter._parse_timings([("0", "0:00:00.00", "0:00:01.50", "<b>Tom & Jerry</b>")])
+
+    timing = converter.timings[0]
+    assert timing.text == "<b>Tom & Jerry</b>"
+    assert timing.escaped_text == "&lt;b&gt;Tom &amp; Jerry&lt;/b&gt;"
+    assert timing.escaped_text in converter._build_template_html()
+    assert '"text":"<b>Tom & Jerry</b>"' in converter._get_timing_data_json()
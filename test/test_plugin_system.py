@@ -0,0 +1,40 @@
+"""
+TemplateComposer のテスト
+"""
+
+from scrollcast.conversion.plugin_system import (
+    PluginConfig, RailwayDisplayPlugin, TemplateComposer, TemplateConfig
+)
+
+TIMING_DATA = '[{"start_time":0,"duration":1000}]'
+TEMPLATE_CONFIG = TemplateConfig(
+    template_name="railway_scroll",
+    navigation_unit="line",
+    required_plugins=("auto_play", "railway_display"),
+)
+
+
+class PatchedRailwayDisplayPlugin(RailwayDisplayPlugin):
+    """JSを差し替えた表示プラグイン"""
+
+    def _build_javascript_module(self) -> str:
+        return "window.RailwayDisplayPlugin = { patched: true };"
+
+
+def test_register_plugin_replaces_composed_module():
+    composer = TemplateComposer()
+    original = composer.compose_template(TEMPLATE_CONFIG, TIMING_DATA)
+    assert "patched: true" not in original["javascript"]
+
+    config = PluginConfig(name="railway_display", dependencies=["auto_play"])
+    composer.plugin_registry.register_plugin(PatchedRailwayDisplayPlugin(config))
+
+    assert "patched: true" in composer.compose_template(TEMPLATE_CONFIG, TIMING_DATA)["javascript"]
+
+
+def test_display_plugins_are_subscribed_after_initialization():
+    javascript = TemplateComposer().compose_template(TEMPLATE_CONFIG, TIMING_DATA)["javascript"]
+
+    init_index = javascript.index("window.RailwayDisplayPlugin.initialize(")
+    subscribe_index = javascript.index("window.RailwayDisplayPlugin.handleSequenceStart(detail)")
+    assert init_index < subscribe_index
@@ -230,9 +230,8 @@ class {self.class_name}Template(BaseTemplate):
 """
 
 import re
-import json
-from typing import List, Tuple, NamedTuple
-from .utils import ASSTimeUtils, ASSMetadataExtractor, ASSDialogueParser
+from typing import Iterable, List, Tuple, NamedTuple
+from .utils import ASSTimeUtils, ASSMetadataExtractor, ASSDialogueStream, JSONUtils, escape_text
 from .plugin_system import TemplateConfig
 from .plugin_converter_base import PluginConverterBase
 
@@ -249,6 +248,9 @@ class {self.class_name}Timing(NamedTuple):
 class {self.class_name}PluginConverter(PluginConverterBase):
     """プラグイン型{self.class_name} ASS→HTML変換クラス"""
     
+    # 基底クラスが__slots__を使うため、追加するインスタンス属性はすべてここに列挙する
+    __slots__ = ('timings',)
+    
     def __init__(self):
         super().__init__()
         self.timings: List[{self.class_name}Timing] = []
@@ -277,20 +279,18 @@ class {self.class_name}PluginConverter(PluginConverterBase):
         # メタデータ抽出
         self.metadata = ASSMetadataExtractor.extract_metadata(content, "{self.class_name}")
         
-        # Dialogue行の抽出と総時間計算
-        dialogue_matches = ASSDialogueParser.parse_dialogues(content)
-        self.total_duration_ms = ASSDialogueParser.calculate_total_duration(dialogue_matches)
+        # Dialogue行の解析と総時間計算
+        dialogue_stream = ASSDialogueStream(content)
+        self._parse_timings(dialogue_stream)
+        self.total_duration_ms = dialogue_stream.total_duration_ms
         self.metadata.total_duration_ms = self.total_duration_ms
-        
-        # タイミング解析
-        self._parse_timings(dialogue_matches)
     
-    def _parse_timings(self, dialogue_matches: List[Tuple[str, str, str, str]]) -> None:
+    def _parse_timings(self, dialogue_matches: Iterable[Tuple[str, str, str, str]]) -> None:
         """タイミング解析"""
         self.timings = []
         
         for line_index, (layer, start_time, end_time, text_with_tags) in enumerate(dialogue_matches):
-            if int(layer) == 0:  # メイン行のみ処理
+            if not layer.lstrip('0'):  # メイン行のみ処理
                 # ASSタグを除去してクリーンなテキストを取得
                 clean_text = self.remove_ass_tags(text_with_tags)
                 
@@ -310,29 +310,25 @@ class {self.class_name}PluginConverter(PluginConverterBase):
     
     def _get_timing_data_json(self) -> str:
         """タイミングデータのJSON文字列を返す"""
-        timing_data = []
-        for timing in self.timings:
-            timing_data.append({{
+        timing_data = [
+            {{
                 "text": timing.text,
                 "start_time": timing.start_time_ms,
                 "duration": timing.duration_ms,
                 "line_index": timing.line_index
-            }})
+            }}
+            for timing in self.timings
+        ]
         
-        return json.dumps(timing_data, ensure_ascii=False, indent=2)
+        return JSONUtils.dumps(timing_data)
     
     def _build_template_html(self) -> str:
         """テンプレート固有HTML"""
-        html_parts = []
-        html_parts.append(f'<div class="text-container" data-template="{self.category}">')
-        
-        for timing in self.timings:
-            html_parts.append(
-                f'    <div class="text-line" data-line="{{timing.line_index}}">{{timing.text}}</div>'
-            )
-        
-        html_parts.append('</div>')
-        return '\n'.join(html_parts)
+        lines_html = '\\n'.join([
+            f'    <div class="text-line" data-line="{{timing.line_index}}">{{escape_text(timing.text)}}</div>'
+            for timing in self.timings
+        ])
+        return f'<div class="text-container" data-template="{self.category}">\\n{{lines_html}}\\n</div>'
     
     def _build_ui_elements_html(self) -> str:
         """UI要素HTML"""
@@ -467,14 +463,12 @@ window.{self.class_name}DisplayPlugin = {{
     initialize: function(config) {{
         this.config = config;
         this.lines = document.querySelectorAll('.text-line');
-        this.setupDisplayHandlers();
         this.initializeDisplay();
     }},
     
-    setupDisplayHandlers: function() {{
-        window.addEventListener('sequence_start', (event) => {{
-            this.playSequence(event.detail.index, event.detail.data);
-        }});
+    // sequence_start ハンドラー（購読は ScrollCastCore.initializePlugins が行う）
+    handleSequenceStart: function(detail) {{
+        this.playSequence(detail.index, detail.data);
     }},
     
     initializeDisplay: function() {{